@@ -16,7 +16,14 @@ class NodeID(str):
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
-        return core_schema.no_info_after_validator_function(cls, handler(str))
+        from_str = core_schema.no_info_after_validator_function(cls, handler(str))
+        # Existing NodeIDs are kept as-is so every edge and node referencing an
+        # id shares one string object instead of validating into a fresh copy.
+        return core_schema.json_or_python_schema(
+            json_schema=from_str,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_str]),
+            serialization=core_schema.to_string_ser_schema(),
+        )
 
 
 class StaticAnalyzerIssue(BaseModel):
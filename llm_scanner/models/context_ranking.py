@@ -17,6 +17,10 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from models.context import CodeContextNode
 
+# libyaml-backed C loader/dumper when available; same safe-subset semantics.
+_YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: Final = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class EvidenceRole(StrEnum):
     """Role tags assigned to context nodes by the semantic annotator.
@@ -86,7 +90,7 @@ class BudgetedRankingConfig(BaseModel):
     def from_yaml(cls, path: Path) -> "BudgetedRankingConfig":
         """Load a config from a YAML file."""
 
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
         if not isinstance(raw, dict):
             raise ValueError(f"budgeted ranking config YAML must be a mapping: {path}")
         return cls.model_validate(raw)
@@ -97,7 +101,7 @@ class BudgetedRankingConfig(BaseModel):
         path.parent.mkdir(parents=True, exist_ok=True)
         payload: dict[str, Any] = self.model_dump()
         path.write_text(
-            yaml.safe_dump(payload, sort_keys=False, default_flow_style=False),
+            yaml.dump(payload, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False),
             encoding="utf-8",
         )
 
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable, Mapping
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import MappingProxyType
@@ -31,6 +32,44 @@ _SEVERITY_RANK: Final = MappingProxyType(
 )
 
 
+def _bandit_tool_message(finding: FindingNode) -> str:
+    """Describe a Bandit finding for the review prompt.
+
+    Raises:
+        TypeError: If ``finding`` is not a Bandit finding.
+    """
+
+    if not isinstance(finding, BanditFindingNode):
+        raise TypeError(f"Expected a Bandit finding, got {type(finding).__name__}")
+    return (
+        f"Bandit [CWE-{finding.cwe_id}] severity={finding.severity}"
+        f" at {finding.file}:{finding.line_number}"
+    )
+
+
+def _dlint_tool_message(finding: FindingNode) -> str:
+    """Describe a Dlint finding for the review prompt.
+
+    Raises:
+        TypeError: If ``finding`` is not a Dlint finding.
+    """
+
+    if not isinstance(finding, DlintFindingNode):
+        raise TypeError(f"Expected a Dlint finding, got {type(finding).__name__}")
+    return f"Dlint [issue={finding.issue_id}] at {finding.file}:{finding.line_number}"
+
+
+# Looked up by exact finding type instead of walking an isinstance chain.
+_TOOL_MESSAGE_BUILDERS: Final[Mapping[type[FindingNode], Callable[[FindingNode], str]]] = (
+    MappingProxyType(
+        {
+            BanditFindingNode: _bandit_tool_message,
+            DlintFindingNode: _dlint_tool_message,
+        }
+    )
+)
+
+
 class GeneralScannerPipeline(BaseModel):
     """Orchestrates CPG construction, static analysis, and LLM-based code review."""
 
@@ -102,8 +141,9 @@ class GeneralScannerPipeline(BaseModel):
     ) -> list[ReviewItem]:
         items: list[ReviewItem] = []
         project_root = self.src.resolve()
+        neighborhoods = assembler.fetch_context_nodes_by_root_id(root_ids)
         for root_id in root_ids:
-            context_nodes = assembler.fetch_context_nodes_for_root_ids([root_id])
+            context_nodes = neighborhoods.get(root_id, [])
             if not context_nodes:
                 _LOGGER.warning("No context nodes found for root_id %s; skipping", root_id)
                 continue
@@ -160,24 +200,18 @@ class GeneralScannerPipeline(BaseModel):
             if isinstance(f, DlintFindingNode)
             or (isinstance(f, BanditFindingNode) and _SEVERITY_RANK[f.severity] >= min_rank)
         ]
-        kept_ids = {str(f.identifier) for f in filtered_findings}
-        filtered_edges = [e for e in all_edges if e.src in kept_ids]
+        # Each kept finding's message is built once, however many nodes it reports on.
+        message_by_id: dict[str, str] = {
+            str(finding.identifier): _TOOL_MESSAGE_BUILDERS[type(finding)](finding)
+            for finding in filtered_findings
+        }
 
-        finding_by_id: dict[str, FindingNode] = {str(f.identifier): f for f in all_findings}
         root_to_messages: dict[str, list[str]] = {}
-        for edge in filtered_edges:
-            finding = finding_by_id[edge.src]
-            if isinstance(finding, BanditFindingNode):
-                msg = (
-                    f"Bandit [CWE-{finding.cwe_id}] severity={finding.severity}"
-                    f" at {finding.file}:{finding.line_number}"
-                )
-            else:
-                assert isinstance(finding, DlintFindingNode)
-                msg = f"Dlint [issue={finding.issue_id}] at {finding.file}:{finding.line_number}"
-            root_to_messages.setdefault(str(edge.dst), []).append(msg)
+        for edge in all_edges:
+            if edge.src in message_by_id:
+                root_to_messages.setdefault(str(edge.dst), []).append(message_by_id[edge.src])
 
-        root_ids = list({str(e.dst) for e in filtered_edges})
+        root_ids = list(root_to_messages)
         _LOGGER.info(
             "Full scan: %d findings → %d unique root code nodes (min severity: %s)",
             len(filtered_findings),
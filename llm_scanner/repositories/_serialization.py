@@ -1,50 +1,47 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 
 from models.base import NodeID
 from models.nodes import Node
 
 
-def flatten_node_rows(nodes: Mapping[NodeID, Node]) -> list[dict[str, object]]:
+def flatten_node_rows(nodes: Mapping[NodeID, Node]) -> Iterator[dict[str, object]]:
     """Flatten structured nodes into dictionaries for file serialization.
 
+    Rows are yielded one at a time so large graphs can be written out
+    without materializing every row first.
+
     Args:
         nodes: Mapping of node identifiers to structured node instances.
 
-    Returns:
-        List of dictionaries that merge the identifier, node kind, and the
-        node's own fields for easier persistence.
+    Yields:
+        Dictionaries that merge the identifier, node kind, and the node's own
+        fields for easier persistence.
     """
 
-    rows: list[dict[str, object]] = []
     for node_id, node in nodes.items():
-        payload = node.model_dump(mode="json")
         row: dict[str, object] = {"id": str(node_id), "kind": node.__class__.__name__}
-        row.update(payload)
-        rows.append(row)
-    return rows
+        row.update(node.model_dump(mode="json"))
+        yield row
 
 
-def graph_node_rows(nodes: Mapping[NodeID, Node]) -> list[dict[str, object]]:
+def graph_node_rows(nodes: Mapping[NodeID, Node]) -> Iterator[dict[str, object]]:
     """Build property rows used by graph repositories.
 
+    Rows are yielded one at a time so callers can group them as they go.
+
     Args:
         nodes: Mapping of node identifiers to structured node instances.
 
-    Returns:
-        List of dictionaries with metadata and attribute maps for ingestion by
-        Neo4j or other graph stores.
+    Yields:
+        Dictionaries with metadata and attribute maps for ingestion by Neo4j
+        or other graph stores.
     """
 
-    rows: list[dict[str, object]] = []
     for node_id, node in nodes.items():
-        payload = node.model_dump(mode="json")
-        rows.append(
-            {
-                "id": node_id,
-                "node_kind": node.__class__.__name__,
-                "name": payload.get("name"),
-                "file_path": str(node.file_path),
-                "attrs": payload,
-            }
-        )
-    return rows
+        yield {
+            "id": node_id,
+            "node_kind": node.__class__.__name__,
+            "name": getattr(node, "name", None),
+            "file_path": str(node.file_path),
+            "attrs": node.model_dump(mode="json"),
+        }
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 
 from models.edges.analysis import StaticAnalysisReports
 from models.nodes.finding import FindingNode
-from repositories.base import Neo4jRepository
+from repositories.base import FINDING_WRITE_BATCH_SIZE, Neo4jRepository, write_rows_in_batches
 from repositories.queries import finding_relationship_query
 
 
@@ -25,11 +25,6 @@ class IFindingsRepository(Neo4jRepository, ABC):
     def insert_edges(self, finding_relations: list[StaticAnalysisReports]) -> None:
         """Insert finding relationships into the database.
 
-        Args:
-            finding_relations: List of relationships connecting findings to code.
-        """
-        """Insert Dlint finding relationships into Neo4j.
-
         Args:
             finding_relations: List of relationships connecting findings to code.
         """
@@ -37,14 +32,10 @@ class IFindingsRepository(Neo4jRepository, ABC):
         if not finding_relations:
             return
 
-        rows: list[dict[str, str]] = []
-        for rel in finding_relations:
-            rows.append(
-                {
-                    "src": str(rel.src),
-                    "dst": str(rel.dst),
-                }
-            )
-
-        query = finding_relationship_query("REPORTS")
-        self.client.run_write(query, {"rows": rows})
+        rows: list[dict[str, object]] = [
+            {"src": str(rel.src), "dst": str(rel.dst)} for rel in finding_relations
+        ]
+
+        write_rows_in_batches(
+            self.client, finding_relationship_query("REPORTS"), rows, FINDING_WRITE_BATCH_SIZE
+        )
@@ -1,5 +1,6 @@
 from models.nodes.finding import DlintFindingNode
 from repositories.analyzers.base import IFindingsRepository
+from repositories.base import FINDING_WRITE_BATCH_SIZE, write_rows_in_batches
 from repositories.queries import finding_node_query
 
 
@@ -32,5 +33,6 @@ class DlintFindingsRepository(IFindingsRepository):
             for finding in findings_nodes
         ]
 
-        query = finding_node_query("DlintFinding")
-        self.client.run_write(query, {"rows": rows})
+        write_rows_in_batches(
+            self.client, finding_node_query("DlintFinding"), rows, FINDING_WRITE_BATCH_SIZE
+        )
@@ -10,6 +10,8 @@ CORE_INDEX_QUERIES: Final[tuple[LiteralString, ...]] = (
     "CREATE INDEX finding_id IF NOT EXISTS FOR (f:Finding) ON (f.id)",
 )
 
+FINDING_WRITE_BATCH_SIZE: Final[int] = 2_000
+
 _INDEXED_URIS: set[str] = set()
 
 
@@ -40,6 +42,25 @@ def ensure_core_indexes(client: Neo4jClient) -> None:
         _INDEXED_URIS.add(uri)
 
 
+def write_rows_in_batches(
+    client: Neo4jClient,
+    query: LiteralString,
+    rows: list[dict[str, object]],
+    batch_size: int,
+) -> None:
+    """Execute an ``UNWIND $rows`` write query in bounded transactions.
+
+    Args:
+        client: Neo4j client used to execute the writes.
+        query: Cypher write query to execute.
+        rows: Serialized rows passed as the `rows` parameter.
+        batch_size: Maximum number of rows per transaction.
+    """
+
+    for start_index in range(0, len(rows), batch_size):
+        client.run_write(query, {"rows": rows[start_index : start_index + batch_size]})
+
+
 class Neo4jRepository(BaseModel):
     client: Neo4jClient
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -11,6 +11,7 @@ from repositories.base import ensure_core_indexes
 from repositories.queries import (
     backward_dataflow_taint_query,
     code_bfs_nodes_batch_query,
+    code_bfs_nodes_multi_source_query,
     code_bfs_nodes_query,
     code_nodes_by_file_span_query,
     code_traversal_relationship_types,
@@ -205,7 +206,7 @@ class ContextRepository(BaseModel):
             )
 
         else:
-            query = code_bfs_nodes_batch_query(max_depth, self.traversal_relationship_types)
+            query = code_bfs_nodes_multi_source_query(max_depth, self.traversal_relationship_types)
             rows = self.client.run_read(
                 query,
                 {
@@ -221,12 +222,51 @@ class ContextRepository(BaseModel):
 
         return self._build_context_nodes(rows)
 
+    def fetch_code_neighborhoods_by_start_id(
+        self, start_node_ids: list[str], max_depth: int
+    ) -> dict[str, list[CodeContextNode]]:
+        """Return a separate BFS neighborhood for each start node in one query.
+
+        Unlike :meth:`fetch_code_neighborhood_batch`, which merges every start
+        node's neighborhood into one list, rows are partitioned by the start
+        node they were reached from.
+
+        Args:
+            start_node_ids: Identifiers of code nodes to start from.
+            max_depth: Maximum traversal depth.
+
+        Returns:
+            Mapping of start node identifier to its neighboring code nodes.
+            Start nodes missing from the graph are absent from the mapping.
+        """
+
+        if not start_node_ids:
+            return {}
+
+        query = code_bfs_nodes_batch_query(max_depth, self.traversal_relationship_types)
+        rows = self.client.run_read(
+            query,
+            {
+                "start_ids": sorted(set(start_node_ids)),
+                "max_depth": max_depth,
+            },
+        )
+
+        rows_by_start_id: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            rows_by_start_id.setdefault(str(row["start_id"]), []).append(row)
+
+        return {
+            start_id: self._build_context_nodes(start_rows)
+            for start_id, start_rows in rows_by_start_id.items()
+        }
+
     def fetch_code_neighborhood_with_edge_paths(
         self, start_node_ids: list[str], max_depth: int
     ) -> list[CodeContextNode]:
         """Return BFS expansion annotated with per-edge-type minimum depths.
 
-        Calls the batch BFS query once per configured edge type and merges
+        Calls the multi-source BFS query once per configured edge type and merges
         results by node identifier, populating ``edge_depths`` with the
         shallowest depth at which each node is reachable via each edge type.
 
@@ -255,7 +295,7 @@ class ContextRepository(BaseModel):
                     {"start_id": unique_start_ids[0], "max_depth": max_depth},
                 )
             else:
-                query = code_bfs_nodes_batch_query(max_depth, (edge_type,))
+                query = code_bfs_nodes_multi_source_query(max_depth, (edge_type,))
                 rows = self.client.run_read(
                     query,
                     {"start_ids": list(unique_start_ids), "max_depth": max_depth},
@@ -375,35 +415,45 @@ class ContextRepository(BaseModel):
 
         Returns:
             Unique context nodes preserving first-seen order, shallowest depth,
-            and duplicate counts.
+            and duplicate counts. Rows already deduplicated by the database
+            carry their own ``repeats`` count.
         """
 
-        nodes_by_id: dict[NodeID, CodeContextNode] = {}
-        ordered_node_ids: list[NodeID] = []
+        # Duplicates are folded into plain ints first so each model is built
+        # once, instead of paying pydantic attribute assignment per repeat row.
+        first_rows: dict[str, dict[str, Any]] = {}
+        depths: dict[str, int] = {}
+        repeats: dict[str, int] = {}
 
         for row in rows:
-            node_id = NodeID(str(row["id"]))
+            node_id = str(row["id"])
             row_depth = int(row.get("depth", 0))
-            if node_id in nodes_by_id:
-                existing_node = nodes_by_id[node_id]
-                existing_node.repeats += 1
-                existing_node.depth = min(existing_node.depth, row_depth)
+            row_repeats = int(row.get("repeats") or 0)
+            if node_id in first_rows:
+                repeats[node_id] += row_repeats + 1
+                if row_depth < depths[node_id]:
+                    depths[node_id] = row_depth
                 continue
 
-            nodes_by_id[node_id] = CodeContextNode(
-                identifier=node_id,
+            first_rows[node_id] = row
+            depths[node_id] = row_depth
+            repeats[node_id] = row_repeats
+
+        return [
+            CodeContextNode(
+                identifier=NodeID(node_id),
                 node_kind=self._coerce_str(row.get("node_kind")),
                 name=self._coerce_str(row.get("name")),
                 file_path=Path(str(row.get("node_file_path") or row.get("file_path", ""))),
                 line_start=int(row["line_start"]),
                 line_end=int(row["line_end"]),
-                depth=row_depth,
+                depth=depths[node_id],
+                repeats=repeats[node_id],
                 finding_evidence_score=float(row.get("finding_evidence_score") or 0.0),
                 security_path_score=float(row.get("security_path_score") or 0.0),
             )
-            ordered_node_ids.append(node_id)
-
-        return [nodes_by_id[node_id] for node_id in ordered_node_ids]
+            for node_id, row in first_rows.items()
+        ]
 
     @staticmethod
     def _coerce_str(value: Any | None) -> str | None:
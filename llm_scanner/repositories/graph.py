@@ -1,5 +1,7 @@
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Final, LiteralString
 
 from clients.neo4j import Neo4jClient
@@ -7,7 +9,7 @@ from models.base import NodeID
 from models.edges import RelationshipBase
 from models.nodes import Node
 from repositories._serialization import graph_node_rows
-from repositories.base import ensure_core_indexes
+from repositories.base import ensure_core_indexes, write_rows_in_batches
 from repositories.queries import (
     NODE_QUERY_BY_LABEL,
     RELATIONSHIP_QUERY_BY_TYPE,
@@ -26,6 +28,7 @@ _LOGGER = logging.getLogger(__name__)
 
 NODE_WRITE_BATCH_SIZE: Final[int] = 2_000
 EDGE_WRITE_BATCH_SIZE: Final[int] = 2_000
+MAX_WRITE_WORKERS: Final[int] = 8
 
 
 class GraphRepository(Neo4jClient):
@@ -45,23 +48,39 @@ class GraphRepository(Neo4jClient):
 
         self.client.run_write("MATCH (n) DETACH DELETE n")
 
-    def _write_rows_in_batches(
+    def _write_groups_concurrently(
         self,
-        query: LiteralString,
-        rows: list[dict[str, object]],
+        queries: Mapping[str, LiteralString],
+        rows_by_key: dict[str, list[dict[str, object]]],
         batch_size: int,
+        kind: str,
     ) -> None:
-        """Execute a write query over a large payload in smaller batches.
+        """Write independent row groups in parallel sessions.
+
+        Each group targets a different label or relationship type, so the
+        groups do not depend on each other. The Neo4j driver releases the GIL
+        while waiting on Bolt I/O, which lets the writes overlap. The call
+        returns only after every group has been written.
 
         Args:
-            query: Cypher write query to execute.
-            rows: Serialized rows passed as the `rows` parameter.
+            queries: Write query for each group key.
+            rows_by_key: Serialized rows grouped by label or relationship type.
             batch_size: Maximum number of rows per transaction.
+            kind: Human-readable group kind used in log messages.
         """
 
-        for start_index in range(0, len(rows), batch_size):
-            batch_rows = rows[start_index : start_index + batch_size]
-            self.client.run_write(query, {"rows": batch_rows})
+        if not rows_by_key:
+            return
+
+        def _write_group(key: str) -> None:
+            rows = rows_by_key[key]
+            write_rows_in_batches(self.client, queries[key], rows, batch_size)
+            _LOGGER.info("Loaded %d %s with type %s.", len(rows), kind, key)
+
+        max_workers = min(MAX_WRITE_WORKERS, len(rows_by_key))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so that worker exceptions propagate.
+            list(executor.map(_write_group, rows_by_key))
 
     def load(self, nodes: dict[NodeID, Node], edges: list[RelationshipBase]) -> None:
         """Load nodes and relationships into Neo4j.
@@ -73,43 +92,35 @@ class GraphRepository(Neo4jClient):
 
         self._clear_database()
         _LOGGER.info("Start loading %d nodes and %d edges into Neo4j.", len(nodes), len(edges))
-        node_rows = graph_node_rows(nodes)
         nodes_by_label: dict[str, list[dict[str, object]]] = defaultdict(list)
-        for row in node_rows:
+        for row in graph_node_rows(nodes):
             node_kind = str(row["node_kind"])
             label = NODE_KIND_TO_LABEL[node_kind]
             nodes_by_label[label].append(row)
 
-        for label, rows in nodes_by_label.items():
-            query_nodes = NODE_QUERY_BY_LABEL[label]
-            self._write_rows_in_batches(query_nodes, rows, NODE_WRITE_BATCH_SIZE)
-            _LOGGER.info("Loaded %d nodes with label %s.", len(rows), label)
+        # Edge queries MATCH on node ids, so all node writes must finish first.
+        self._write_groups_concurrently(
+            NODE_QUERY_BY_LABEL, nodes_by_label, NODE_WRITE_BATCH_SIZE, "nodes"
+        )
 
         edge_rows_by_type: dict[str, list[dict[str, object]]] = defaultdict(list)
         for rel in edges:
-            payload: dict[str, object] = rel.model_dump(mode="json")
-            rel_type_raw = payload["type"]
+            attrs: dict[str, object] = rel.model_dump(mode="json", exclude={"src", "dst"})
+            rel_type_raw = attrs["type"]
             if rel_type_raw is None:
                 rel_type_raw = rel.__class__.__name__
-                payload["type"] = rel_type_raw
+                attrs["type"] = rel_type_raw
 
             rel_type = str(rel_type_raw)
-            # rel_type = self._relationship_type_for_edge(str(rel_type_raw))
-
-            attrs = dict(payload)
-            attrs.pop("src", None)
-            attrs.pop("dst", None)
-
             edge_rows_by_type[rel_type].append(
                 {
-                    "src": str(payload.get("src")),
-                    "dst": str(payload.get("dst")),
+                    "src": str(rel.src),
+                    "dst": str(rel.dst),
                     "type": rel_type,
                     "attrs": attrs,
                 }
             )
 
-        for rel_type, rows in edge_rows_by_type.items():
-            query_edges = RELATIONSHIP_QUERY_BY_TYPE[rel_type]
-            self._write_rows_in_batches(query_edges, rows, EDGE_WRITE_BATCH_SIZE)
-            _LOGGER.info("Loaded %d edges with type %s.", len(rows), rel_type)
+        self._write_groups_concurrently(
+            RELATIONSHIP_QUERY_BY_TYPE, edge_rows_by_type, EDGE_WRITE_BATCH_SIZE, "edges"
+        )
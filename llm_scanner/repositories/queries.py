@@ -267,6 +267,52 @@ def code_bfs_nodes_batch_query(
     return cast(LiteralString, query)
 
 
+def code_bfs_nodes_multi_source_query(
+    max_depth: int,
+    relationship_types: tuple[str, ...] | None = None,
+) -> LiteralString:
+    """Return a bounded literal query for one BFS traversal seeded by many start nodes.
+
+    Unlike :func:`code_bfs_nodes_batch_query`, each reached node is returned
+    once with its shallowest depth across all start nodes. ``repeats`` counts
+    the additional start nodes that reach it.
+
+    Args:
+        max_depth: Maximum traversal depth.
+
+    Returns:
+        Literal query used to fetch deduplicated code nodes within a depth limit.
+    """
+
+    depth = _validated_depth(max_depth)
+    rel_union = _relationship_union_pattern(relationship_types)
+
+    if depth == 0 or not rel_union:
+        query = (
+            "MATCH (start:Code) WHERE start.id IN $start_ids "
+            "RETURN start.id AS id, start.file_path AS file_path, "
+            "start.line_start AS line_start, start.line_end AS line_end, "
+            "start.name AS name, start.node_kind AS node_kind, 0 AS depth, 0 AS repeats, "
+            "start.finding_evidence_score AS finding_evidence_score, "
+            "start.security_path_score AS security_path_score "
+        )
+        return cast(LiteralString, query)
+
+    query = (
+        "UNWIND $start_ids AS sid "
+        "MATCH p=(start:Code {id: sid})"
+        f"-[:{rel_union}*0..{depth}]-(n:Code) "
+        "WITH sid, n, min(length(p)) AS start_depth "
+        "WITH n, min(start_depth) AS depth, count(sid) - 1 AS repeats "
+        "RETURN n.id AS id, n.file_path AS file_path, "
+        "n.line_start AS line_start, n.line_end AS line_end, "
+        "n.name AS name, n.node_kind AS node_kind, depth, repeats, "
+        "n.finding_evidence_score AS finding_evidence_score, "
+        "n.security_path_score AS security_path_score "
+    )
+    return cast(LiteralString, query)
+
+
 def code_nodes_by_file_span_query() -> LiteralString:
     """Return a literal query for code nodes overlapping file spans."""
 
@@ -26,8 +26,10 @@ class BanditAnalyzerService(BaseAnalyzerService):
             Finding payload with cwe_id.
         """
 
-        payload = issue.model_dump()
-        payload["cwe_id"] = payload.pop("cwe", None)
-        payload.pop("column_number", None)
-        payload.pop("line_range", None)
-        return payload
+        return {
+            "file": issue.file,
+            "line_number": issue.line_number,
+            "reason": issue.reason,
+            "cwe_id": issue.cwe,
+            "severity": issue.severity,
+        }
@@ -6,7 +6,7 @@ from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from clients.analyzers.base import IStaticAnalyzer
 from models.base import StaticAnalyzerIssue
@@ -26,6 +26,8 @@ class BaseAnalyzerService(BaseModel):
     graph_repository: GraphRepository
     findings_repository: IFindingsRepository
 
+    _normalized_paths: dict[Path, Path] = PrivateAttr(default_factory=dict)
+
     @property
     @abstractmethod
     def _finding_node_type(self) -> type[FindingNode]:
@@ -48,9 +50,18 @@ class BaseAnalyzerService(BaseModel):
 
         return issue.model_dump()
 
+    @cached_property
+    def _target_root(self) -> Path:
+        """Return the resolved project root, computed once per service."""
+
+        return self.project_root.resolve()
+
     def _normalize_issue_path(self, file_path: Path) -> Path:
         """Normalize issue paths relative to the scan target.
 
+        Analyzers usually report many issues per file, so results are memoized
+        per reported path.
+
         Args:
             file_path: Path reported by the analyzer.
 
@@ -58,16 +69,37 @@ class BaseAnalyzerService(BaseModel):
             Relative path suitable for repository and graph matching.
         """
 
-        target_root: Path = self.project_root.resolve()
-        absolute_path: Path = (
-            file_path if file_path.is_absolute() else (target_root / file_path)
-        ).resolve()
-        try:
-            relative_path: Path = absolute_path.relative_to(target_root)
-            return Path(relative_path.as_posix())
-        except ValueError:
-            rel_str: str = os.path.relpath(absolute_path.as_posix(), target_root.as_posix())
-            return Path(rel_str)
+        normalized = self._normalized_paths.get(file_path)
+        if normalized is None:
+            normalized = self._compute_normalized_path(file_path)
+            self._normalized_paths[file_path] = normalized
+        return normalized
+
+    @cached_property
+    def _target_root_prefix(self) -> str:
+        """Return the resolved project root as a POSIX string ending in ``/``."""
+
+        root_str = self._target_root.as_posix()
+        return root_str if root_str.endswith("/") else f"{root_str}/"
+
+    def _compute_normalized_path(self, file_path: Path) -> Path:
+        """Resolve ``file_path`` and express it relative to the target root.
+
+        The path is still resolved so symlinks match the CPG builder's node
+        paths, but paths under the root are made relative by slicing off the
+        root prefix instead of walking path parts.
+        """
+
+        target_root: Path = self._target_root
+        absolute_str: str = (
+            (file_path if file_path.is_absolute() else (target_root / file_path))
+            .resolve()
+            .as_posix()
+        )
+        prefix = self._target_root_prefix
+        if absolute_str.startswith(prefix):
+            return Path(absolute_str[len(prefix) :])
+        return Path(os.path.relpath(absolute_str, target_root.as_posix()))
 
     def get_findings_with_edges(
         self, nodes: list[Node]
@@ -80,30 +112,34 @@ class BaseAnalyzerService(BaseModel):
 
         report = self._static_analyzer.run()
 
+        # Buckets are keyed by the path string: hashing and comparing ``str``
+        # is much cheaper than ``Path`` when probing every code node.
         findings: list[FindingNode] = []
+        findings_by_file: dict[str, list[FindingNode]] = defaultdict(list)
         for issue in report.issues:
-            normalized_path = self._normalize_issue_path(issue.file)
             payload = self._issue_payload(issue)
-            payload["file"] = normalized_path
+            payload["file"] = self._normalize_issue_path(issue.file)
             finding = self._finding_node_type(**payload)
             findings.append(finding)
+            findings_by_file[str(finding.file)].append(finding)
 
-        file_nodes: dict[Path, list[Node]] = defaultdict(list)
+        file_nodes: dict[str, list[Node]] = defaultdict(list)
         for node in nodes:
-            file_nodes[node.file_path].append(node)
+            node_file = str(node.file_path)
+            if node_file in findings_by_file:
+                file_nodes[node_file].append(node)
 
         edges: list[StaticAnalysisReports] = []
-        for finding in findings:
-            matched_nodes = file_nodes.get(finding.file, [])
+        for file_path, file_findings in findings_by_file.items():
+            matched_nodes = file_nodes.get(file_path)
             if not matched_nodes:
                 continue
-            for node in matched_nodes:
-                if node.line_start <= finding.line_number <= node.line_end:
-                    edges.append(
-                        StaticAnalysisReports(
-                            src=str(finding.identifier),
-                            dst=node.identifier,
-                        )
-                    )
+            for finding in file_findings:
+                finding_id = str(finding.identifier)
+                edges.extend(
+                    StaticAnalysisReports(src=finding_id, dst=node.identifier)
+                    for node in matched_nodes
+                    if node.line_start <= finding.line_number <= node.line_end
+                )
 
         return findings, edges
@@ -26,8 +26,9 @@ class DlintAnalyzerService(BaseAnalyzerService):
             Finding payload with issue_id.
         """
 
-        payload = issue.model_dump()
-        payload["issue_id"] = issue.id
-        payload.pop("code", None)
-        payload.pop("column_number", None)
-        return payload
+        return {
+            "file": issue.file,
+            "line_number": issue.line_number,
+            "reason": issue.reason,
+            "issue_id": issue.id,
+        }
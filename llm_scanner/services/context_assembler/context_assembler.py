@@ -3,7 +3,7 @@ from collections import defaultdict, deque
 from collections.abc import Callable
 from pathlib import Path
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 from models.base import NodeID
 from models.context import CodeContextNode, Context, FileSpans
@@ -30,6 +30,8 @@ class ContextAssemblerService(BaseModel):
     ranking_strategy: ContextNodeRankingStrategy
     cached_neighborhood_edges: list[tuple[NodeID, NodeID, str]] | None = None
 
+    _file_lines_cache: dict[Path, list[str]] = PrivateAttr(default_factory=dict)
+
     def model_post_init(self, __context: object) -> None:
         """Initialize default ranking strategy when one is not injected."""
 
@@ -110,6 +112,35 @@ class ContextAssemblerService(BaseModel):
         )
         return context_nodes
 
+    def fetch_context_nodes_by_root_id(
+        self, root_ids: list[str]
+    ) -> dict[str, list[CodeContextNode]]:
+        """Fetch a separate context neighborhood for each root node ID.
+
+        Plain BFS neighborhoods for all roots are fetched in a single query.
+        Strategies that need per-edge-type depths fall back to one query per
+        root because the edge-path traversal is already split per edge type.
+        """
+
+        if not root_ids:
+            return {}
+
+        if getattr(self.ranking_strategy, "requires_edge_paths", False):
+            return {
+                root_id: self.fetch_context_nodes_for_root_ids([root_id]) for root_id in root_ids
+            }
+
+        neighborhoods = self._require_repo().fetch_code_neighborhoods_by_start_id(
+            root_ids,
+            self.max_call_depth,
+        )
+        _LOGGER.info(
+            "Fetched context neighborhoods for %d of %d root IDs",
+            len(neighborhoods),
+            len(root_ids),
+        )
+        return neighborhoods
+
     def fetch_taint_scores(self, root_ids: list[str]) -> dict[NodeID, float]:
         """Fetch backward-taint scores for the supplied root node IDs."""
 
@@ -190,9 +221,7 @@ class ContextAssemblerService(BaseModel):
 
         read_lines: dict[Path, dict[int, str]] = defaultdict(dict)
         for file_path, line_numbers in file_lines_to_read.items():
-            lines = (
-                (repo_path / file_path).read_text(encoding="utf-8", errors="ignore").splitlines()
-            )
+            lines = self._read_file_lines(repo_path / file_path)
             for line_number in line_numbers:
                 read_lines[file_path][line_number] = self._sanitize_line(lines[line_number - 1])
 
@@ -206,6 +235,22 @@ class ContextAssemblerService(BaseModel):
 
         return candidate_text, self._estimate_tokens(candidate_text)
 
+    def _read_file_lines(self, file_path: Path) -> list[str]:
+        """Return the lines of ``file_path``, reading each file once per assembler.
+
+        Findings in the same project usually share files, so the split lines
+        are kept across ``assemble_*`` calls. The cache is bounded by
+        ``snippet_cache_max_entries`` files and cleared when full.
+        """
+
+        lines = self._file_lines_cache.get(file_path)
+        if lines is None:
+            lines = file_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+            if len(self._file_lines_cache) >= self.snippet_cache_max_entries:
+                self._file_lines_cache.clear()
+            self._file_lines_cache[file_path] = lines
+        return lines
+
     def _select_nodes_with_path_fill(
         self,
         ranked_nodes: list[CodeContextNode],
@@ -234,6 +279,22 @@ class ContextAssemblerService(BaseModel):
 
         selected_ids: set[NodeID] = set(root_ids)
 
+        nodes_by_id: dict[NodeID, list[CodeContextNode]] = defaultdict(list)
+        for node in ranked_nodes:
+            nodes_by_id[node.identifier].append(node)
+
+        # With the default estimator the rendered length is tracked incrementally
+        # instead of re-rendering the whole selection for every candidate, and
+        # the token budget is checked as a plain character limit.
+        char_budget = self._char_budget_for_tokens(self.token_budget)
+        selected_lines = self._lines_for_selection(ranked_nodes, selected_ids)
+        line_count = sum(len(lines) for lines in selected_lines.values())
+        char_count = sum(
+            len(read_lines[file_path][line_number])
+            for file_path, lines in selected_lines.items()
+            for line_number in lines
+        )
+
         for node in ranked_nodes:
             node_id = node.identifier
             if node_id in selected_ids:
@@ -244,10 +305,28 @@ class ContextAssemblerService(BaseModel):
             if not new_ids:
                 continue
 
-            trial_lines = self._lines_for_selection(ranked_nodes, selected_ids | new_ids)
-            trial_tokens = self._estimate_tokens(self._render_text(read_lines, trial_lines))
-            if trial_tokens <= self.token_budget:
-                selected_ids |= new_ids
+            if self.token_estimator is not None:
+                trial_lines = self._lines_for_selection(ranked_nodes, selected_ids | new_ids)
+                trial_tokens = self._estimate_tokens(self._render_text(read_lines, trial_lines))
+                if trial_tokens <= self.token_budget:
+                    selected_ids |= new_ids
+                continue
+
+            new_lines = self._new_lines_for_ids(new_ids, nodes_by_id, selected_lines)
+            trial_line_count = line_count + len(new_lines)
+            trial_char_count = char_count + sum(
+                len(read_lines[file_path][line_number]) for file_path, line_number in new_lines
+            )
+            # "\n".join inserts one separator between consecutive lines.
+            trial_length = trial_char_count + max(trial_line_count - 1, 0)
+            if trial_length > char_budget:
+                continue
+
+            selected_ids |= new_ids
+            for file_path, line_number in new_lines:
+                selected_lines[file_path].add(line_number)
+            line_count = trial_line_count
+            char_count = trial_char_count
 
         _LOGGER.debug("Selected %d nodes after path-fill", len(selected_ids))
         return selected_ids
@@ -330,6 +409,25 @@ class ContextAssemblerService(BaseModel):
             cursor = parent_to_root.get(cursor)
         return chain
 
+    @staticmethod
+    def _new_lines_for_ids(
+        new_ids: set[NodeID],
+        nodes_by_id: dict[NodeID, list[CodeContextNode]],
+        selected_lines: dict[Path, set[int]],
+    ) -> set[tuple[Path, int]]:
+        """Return ``(file, line)`` pairs covered by ``new_ids`` but not yet selected."""
+
+        new_lines: set[tuple[Path, int]] = set()
+        for node_id in new_ids:
+            for node in nodes_by_id[node_id]:
+                kept = selected_lines.get(node.file_path, set())
+                new_lines.update(
+                    (node.file_path, line_number)
+                    for line_number in range(node.line_start, node.line_end + 1)
+                    if line_number not in kept
+                )
+        return new_lines
+
     @staticmethod
     def _lines_for_selection(
         ranked_nodes: list[CodeContextNode],
@@ -379,4 +477,22 @@ class ContextAssemblerService(BaseModel):
         estimator = self.token_estimator
         if estimator is not None:
             return estimator(text)
-        return max(1, len(text) // 3)
+        return self._estimate_tokens_for_length(len(text))
+
+    @staticmethod
+    def _estimate_tokens_for_length(char_count: int) -> int:
+        """Apply the default token heuristic to a rendered text length."""
+
+        return max(1, char_count // 3)
+
+    @staticmethod
+    def _char_budget_for_tokens(token_budget: int) -> int:
+        """Return the longest rendered length the default heuristic fits in ``token_budget``.
+
+        Returns ``-1`` when no text fits, since the heuristic never estimates
+        fewer than one token.
+        """
+
+        if token_budget < 1:
+            return -1
+        return token_budget * 3 + 2
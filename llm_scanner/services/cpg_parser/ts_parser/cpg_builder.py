@@ -1,23 +1,54 @@
 import ast
 import logging
+import multiprocessing
 import os
+import threading
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
-import tree_sitter_python as tspython
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
-from tree_sitter import Language, Parser, Tree
+from tree_sitter import Parser, Tree
 
 from models.base import NodeID
 from models.edges.base import RelationshipBase
 from models.nodes import Node
+from services.cpg_parser.ts_parser.language import PYTHON_LANGUAGE
 from services.cpg_parser.ts_parser.node_processor import NodeProcessor
+from services.cpg_parser.ts_parser.parse_cache import FileCacheKey, load_file_cpg, save_file_cpg
 from services.cpg_parser.types import ParserResult
 
 _LOGGER = logging.getLogger(__name__)
 
+# Below this many files, process start-up and result pickling cost more than
+# parsing the files serially.
+PARALLEL_MIN_FILES: Final[int] = 32
+
+# tree-sitter parsers are not thread-safe, so each thread reuses its own.
+_PARSER_LOCAL = threading.local()
+
+
+def _thread_parser() -> Parser:
+    """Return the calling thread's Python parser, creating it on first use."""
+
+    parser: Parser | None = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = Parser(PYTHON_LANGUAGE)
+        _PARSER_LOCAL.parser = parser
+    return parser
+
+
+@lru_cache(maxsize=64)
+def _resolved_root(root: Path) -> Path:
+    """Resolve a project root once; every file under it needs the same result."""
+
+    return root.resolve()
+
 
 class CPGFileBuilder(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -25,11 +56,9 @@ class CPGFileBuilder(BaseModel):
     path: Path
     root: Path | None = None
     prebound_symbols: dict[str, NodeID] = Field(default_factory=dict)
-    __parser: Parser = PrivateAttr(default_factory=lambda: Parser(Language(tspython.language())))
+    __parser: Parser = PrivateAttr(default_factory=_thread_parser)
     __tree: Tree = PrivateAttr()
     __source: bytes = PrivateAttr()
-    __source_text: str = PrivateAttr()
-    __lines: list[str] = PrivateAttr()
     __processor: NodeProcessor = PrivateAttr()
     __display_path: Path = PrivateAttr()
 
@@ -37,14 +66,10 @@ class CPGFileBuilder(BaseModel):
         absolute_path: Path = self.path.resolve()
         self.__display_path = self._display_path_for(self.path, absolute_path)
         self.__source = absolute_path.read_bytes()
-        self.__source_text = self.__source.decode("utf-8", errors="replace")
         self.__tree = self.__parser.parse(self.__source)
-        self.__lines = self.__source_text.splitlines()
         self.__processor = NodeProcessor(
             path=self.__display_path,
             source=self.__source,
-            source_text=self.__source_text,
-            lines=self.__lines,
             prebound_symbols=self.prebound_symbols,
         )
         return super().model_post_init(context)
@@ -65,7 +90,7 @@ class CPGFileBuilder(BaseModel):
                 return Path(raw_path.as_posix())
             return absolute_path
 
-        root_path: Path = self.root.resolve()
+        root_path: Path = _resolved_root(self.root)
         try:
             relative_path: Path = absolute_path.relative_to(root_path)
             return Path(relative_path.as_posix())
@@ -79,11 +104,66 @@ class CPGFileBuilder(BaseModel):
         return self.__processor.process(self.__tree.root_node)
 
 
+def _build_file_cpg(path: Path, root: Path, prebound_symbols: dict[str, NodeID]) -> ParserResult:
+    """Parse one file into a CPG; module-level so worker processes can run it."""
+
+    return CPGFileBuilder(path=path, root=root, prebound_symbols=prebound_symbols).build()
+
+
+def _build_file_cpg_or_error(
+    path: Path, root: Path, prebound_symbols: dict[str, NodeID]
+) -> ParserResult | Exception:
+    """Pool worker that returns a parse failure instead of raising it.
+
+    Files are sent to workers in chunks, and a raised exception would discard
+    the results of every other file in the same chunk.
+    """
+
+    try:
+        return _build_file_cpg(path, root, prebound_symbols)
+    except Exception as exc:
+        return exc
+
+
+def _file_cache_key(
+    path: Path, root: Path, prebound_symbols: dict[str, NodeID]
+) -> FileCacheKey | None:
+    """Return the parse-cache key for a file, or ``None`` when it cannot be stat'ed."""
+
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return (
+        str(path),
+        str(root),
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        frozenset(prebound_symbols.items()),
+    )
+
+
 @dataclass(frozen=True)
-class _ExportedNames:
+class _ImportFrom:
+    level: int
+    module: str | None
+    # (imported name, local name) pairs, excluding star imports.
+    names: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class _ModuleSummary:
+    """Top-level names a module defines and the ``from`` imports it makes."""
+
     functions: dict[str, int]
     classes: dict[str, int]
     variables: dict[str, int]
+    import_froms: tuple[_ImportFrom, ...]
+
+
+_EMPTY_MODULE_SUMMARY: Final[_ModuleSummary] = _ModuleSummary(
+    functions={}, classes={}, variables={}, import_froms=()
+)
 
 
 class CPGDirectoryBuilder(BaseModel):
@@ -114,13 +194,21 @@ class CPGDirectoryBuilder(BaseModel):
     )
     on_error: Literal["raise", "skip"] = "raise"
     link_imports: bool = True
+    max_workers: int | None = None
+    # Directory for per-file graphs persisted between runs; None disables it.
+    # Entries are matched on the file's modification time and size. They are
+    # unpickled on load, so the directory must be trusted (never shared with
+    # or writable by other users).
+    cache_dir: Path | None = None
 
     def build(self) -> ParserResult:
         """Build a merged CPG representation from all discovered Python files.
 
         Returns:
             A merged `ParserResult` containing nodes and relationships from all
-            parsed files.
+            parsed files. Every call parses (or loads from `cache_dir`) its own
+            node and relationship objects, so results of separate builds never
+            share state.
 
         Raises:
             ValueError: If `root` does not exist, is not a directory, or if node ID
@@ -133,43 +221,49 @@ class CPGDirectoryBuilder(BaseModel):
 
         module_by_file = {path: self._module_name_for_path(path) for path in python_files}
 
+        # Per-file graphs built during this call, keyed like the on-disk cache.
+        # Files whose pre-bound symbols come out empty reuse their symbol-index
+        # graph in the final merge instead of being parsed twice.
+        results_by_key: dict[FileCacheKey, ParserResult] = {}
+
         symbol_index: dict[str, dict[str, NodeID]] = {}
+        summary_by_file: dict[Path, _ModuleSummary] = {}
         if self.link_imports:
+            # One ``ast`` pass per file feeds both the symbol index and the
+            # per-file import binding below.
+            summary_by_file = {path: self._summarize_module(path) for path in python_files}
             symbol_index = self._build_symbol_index(
                 python_files=python_files,
                 module_by_file=module_by_file,
+                summary_by_file=summary_by_file,
+                results_by_key=results_by_key,
+            )
+
+        prebound_by_file: dict[Path, dict[str, NodeID]] = {
+            file_path: (
+                self._prebound_symbols_for_file(
+                    summary=summary_by_file[file_path],
+                    current_module=module_by_file[file_path],
+                    symbol_index=symbol_index,
+                )
+                if self.link_imports
+                else {}
             )
+            for file_path in python_files
+        }
 
         merged_nodes: dict[NodeID, Node] = {}
         merged_edges: list[RelationshipBase] = []
 
-        for file_path in python_files:
-            try:
-                prebound: dict[str, NodeID] = {}
-                if self.link_imports:
-                    prebound = self._prebound_symbols_for_file(
-                        file_path=file_path,
-                        module_by_file=module_by_file,
-                        symbol_index=symbol_index,
-                    )
-                nodes, edges = CPGFileBuilder(
-                    path=file_path,
-                    root=self.root,
-                    prebound_symbols=prebound,
-                ).build()
-            except Exception:
-                if self.on_error == "raise":
-                    raise
-                _LOGGER.exception("Failed to parse Python file: %s", file_path)
-                continue
-
-            for node_id, node in nodes.items():
-                existing = merged_nodes.get(node_id)
-                if existing is not None and existing != node:
+        for file_path, (nodes, edges) in self._iter_file_results(prebound_by_file, results_by_key):
+            # Files rarely share node ids, so only the key intersection is
+            # compared and the rest is merged by a single C-level update.
+            for node_id in nodes.keys() & merged_nodes.keys():
+                if merged_nodes[node_id] != nodes[node_id]:
                     raise ValueError(
                         f"Duplicate node id {node_id!s} encountered while parsing {file_path}"
                     )
-                merged_nodes[node_id] = node
+            merged_nodes.update(nodes)
 
             merged_edges.extend(edges)
 
@@ -183,28 +277,133 @@ class CPGDirectoryBuilder(BaseModel):
 
         return merged_nodes, merged_edges
 
+    def _iter_file_results(
+        self,
+        prebound_by_file: dict[Path, dict[str, NodeID]],
+        results_by_key: dict[FileCacheKey, ParserResult],
+    ) -> Iterator[tuple[Path, ParserResult]]:
+        """Yield per-file graphs in input order, parsing only files not cached.
+
+        Graphs already in ``results_by_key`` (built earlier in the same
+        ``build`` call) are handed out once more and dropped from it; parsed and
+        disk-loaded graphs are added to it.
+        """
+
+        cached_results: dict[Path, ParserResult] = {}
+        cache_keys: dict[Path, FileCacheKey] = {}
+        pending: dict[Path, dict[str, NodeID]] = {}
+        for file_path, prebound in prebound_by_file.items():
+            cache_key = _file_cache_key(file_path, self.root, prebound)
+            if cache_key is None:
+                pending[file_path] = prebound
+                continue
+            _path, _root, _mtime_ns, size, _prebound = cache_key
+            if size == 0:
+                # Empty files (typically package ``__init__.py`` markers) yield
+                # no nodes, so they skip the parser and the worker round trip.
+                cached_results[file_path] = ({}, [])
+                continue
+            cached = results_by_key.pop(cache_key, None)
+            if cached is None and self.cache_dir is not None:
+                cached = load_file_cpg(self.cache_dir, cache_key)
+                if cached is not None:
+                    results_by_key[cache_key] = cached
+            if cached is not None:
+                cached_results[file_path] = cached
+                continue
+            cache_keys[file_path] = cache_key
+            pending[file_path] = prebound
+
+        # Parsed results arrive in ``pending`` order, a subsequence of the input
+        # order, so both streams are interleaved without materializing all
+        # per-file graphs; files skipped by ``on_error`` never arrive.
+        parsed_results = self._iter_parsed_files(pending)
+        next_parsed = next(parsed_results, None)
+        for file_path in prebound_by_file:
+            result = cached_results.get(file_path)
+            if result is None:
+                if next_parsed is None or next_parsed[0] != file_path:
+                    continue
+                result = next_parsed[1]
+                next_parsed = next(parsed_results, None)
+                cache_key = cache_keys.get(file_path)
+                if cache_key is not None:
+                    results_by_key[cache_key] = result
+                    if self.cache_dir is not None:
+                        save_file_cpg(self.cache_dir, cache_key, result)
+            yield file_path, result
+
+    def _iter_parsed_files(
+        self, prebound_by_file: dict[Path, dict[str, NodeID]]
+    ) -> Iterator[tuple[Path, ParserResult]]:
+        """Parse files and yield their results in input order.
+
+        Files are parsed in a process pool when there are enough of them and
+        more than one worker is allowed; parsing is pure-Python CPU work, so
+        threads would serialize on the GIL. Failures follow ``on_error``.
+        """
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        if max_workers == 1 or len(prebound_by_file) < PARALLEL_MIN_FILES:
+            for file_path, prebound in prebound_by_file.items():
+                try:
+                    result = _build_file_cpg(file_path, self.root, prebound)
+                except Exception:
+                    if self.on_error == "raise":
+                        raise
+                    _LOGGER.exception("Failed to parse Python file: %s", file_path)
+                    continue
+                yield file_path, result
+            return
+
+        # Workers are spawned rather than forked: the caller may be running
+        # other threads (e.g. a Neo4j driver), and forking those is unsafe.
+        # A few chunks per worker keeps the load balanced while cutting the
+        # per-file round trips to the pool.
+        file_paths = list(prebound_by_file)
+        chunksize = max(1, len(file_paths) // (4 * max_workers))
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                _build_file_cpg_or_error,
+                file_paths,
+                repeat(self.root),
+                prebound_by_file.values(),
+                chunksize=chunksize,
+            )
+            for file_path, outcome in zip(file_paths, results, strict=True):
+                if isinstance(outcome, Exception):
+                    if self.on_error == "raise":
+                        executor.shutdown(cancel_futures=True)
+                        raise outcome
+                    _LOGGER.error("Failed to parse Python file: %s", file_path, exc_info=outcome)
+                    continue
+                yield file_path, outcome
+
     def _module_name_for_path(self, file_path: Path) -> str:
         rel = file_path.relative_to(self.root)
         rel = rel.parent if rel.name == "__init__.py" else rel.with_suffix("")
         parts = list(rel.parts)
         return ".".join(parts)
 
-    def _parse_exported_names(self, file_path: Path) -> _ExportedNames:
-        try:
-            source_text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return _ExportedNames(functions={}, classes={}, variables={})
+    def _summarize_module(self, file_path: Path) -> _ModuleSummary:
+        # ``ast.parse`` decodes bytes in C; undecodable sources raise SyntaxError.
+        source_bytes = file_path.read_bytes()
+        if not source_bytes:
+            return _EMPTY_MODULE_SUMMARY
 
         try:
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", SyntaxWarning)
-                tree = ast.parse(source_text, filename=str(file_path))
+                tree = ast.parse(source_bytes, filename=str(file_path))
         except SyntaxError:
-            return _ExportedNames(functions={}, classes={}, variables={})
+            return _EMPTY_MODULE_SUMMARY
 
         functions: dict[str, int] = {}
         classes: dict[str, int] = {}
         variables: dict[str, int] = {}
+        import_froms: list[_ImportFrom] = []
 
         for stmt in tree.body:
             if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
@@ -223,56 +422,77 @@ class CPGDirectoryBuilder(BaseModel):
                 if isinstance(target, ast.Name):
                     variables[target.id] = target.lineno
                 continue
+            if isinstance(stmt, ast.ImportFrom):
+                import_froms.append(
+                    _ImportFrom(
+                        level=stmt.level,
+                        module=stmt.module,
+                        names=tuple(
+                            (alias.name, alias.asname or alias.name)
+                            for alias in stmt.names
+                            if alias.name != "*"
+                        ),
+                    )
+                )
 
-        return _ExportedNames(functions=functions, classes=classes, variables=variables)
+        return _ModuleSummary(
+            functions=functions,
+            classes=classes,
+            variables=variables,
+            import_froms=tuple(import_froms),
+        )
 
     def _build_symbol_index(
         self,
         *,
         python_files: list[Path],
         module_by_file: dict[Path, str],
+        summary_by_file: dict[Path, _ModuleSummary],
+        results_by_key: dict[FileCacheKey, ParserResult],
     ) -> dict[str, dict[str, NodeID]]:
         index: dict[str, dict[str, NodeID]] = {}
 
-        for file_path in python_files:
+        # The unlinked per-file graphs are built through the same pool as the
+        # final merge and kept in ``results_by_key``; files without imports to
+        # bind are then not parsed again there.
+        unlinked_results = self._iter_file_results(
+            {path: {} for path in python_files}, results_by_key
+        )
+        for file_path, (nodes, _edges) in unlinked_results:
             module_name = module_by_file[file_path]
-            exported = self._parse_exported_names(file_path=file_path)
-
-            try:
-                nodes, _edges = CPGFileBuilder(
-                    path=file_path,
-                    root=self.root,
-                    prebound_symbols={},
-                ).build()
-            except Exception:
-                if self.on_error == "raise":
-                    raise
-                _LOGGER.exception("Failed to parse Python file (symbol index): %s", file_path)
-                continue
+            exported = summary_by_file[file_path]
 
-            module_symbols: dict[str, NodeID] = {}
+            # One pass buckets the graph's definitions by kind so each exported
+            # name is a dict lookup; the first node per key wins, as before.
+            functions_by_name: dict[str, NodeID] = {}
+            classes_by_name: dict[str, NodeID] = {}
+            variables_by_name_line: dict[tuple[str, int | None], NodeID] = {}
+            for node_id, node in nodes.items():
+                node_name = getattr(node, "name", None)
+                if node_name is None:
+                    continue
+                if node_id.startswith("function:"):
+                    functions_by_name.setdefault(node_name, node_id)
+                elif node_id.startswith("class:"):
+                    classes_by_name.setdefault(node_name, node_id)
+                elif node_id.startswith("variable:"):
+                    variables_by_name_line.setdefault(
+                        (node_name, getattr(node, "line_start", None)), node_id
+                    )
 
+            module_symbols: dict[str, NodeID] = {}
             for name in exported.functions:
-                for node_id, node in nodes.items():
-                    if getattr(node, "name", None) == name and str(node_id).startswith("function:"):
-                        module_symbols[name] = node_id
-                        break
-
+                function_id = functions_by_name.get(name)
+                if function_id is not None:
+                    module_symbols[name] = function_id
             for name in exported.classes:
-                for node_id, node in nodes.items():
-                    if getattr(node, "name", None) == name and str(node_id).startswith("class:"):
-                        module_symbols[name] = node_id
-                        break
-
+                class_id = classes_by_name.get(name)
+                if class_id is not None:
+                    module_symbols[name] = class_id
             for name, lineno in exported.variables.items():
-                for node_id, node in nodes.items():
-                    if (
-                        getattr(node, "name", None) == name
-                        and getattr(node, "line_start", None) == lineno
-                        and str(node_id).startswith("variable:")
-                    ):
-                        module_symbols[name] = node_id
-                        break
+                variable_id = variables_by_name_line.get((name, lineno))
+                if variable_id is not None:
+                    module_symbols[name] = variable_id
 
             if module_symbols:
                 index[module_name] = module_symbols
@@ -282,33 +502,17 @@ class CPGDirectoryBuilder(BaseModel):
     def _prebound_symbols_for_file(
         self,
         *,
-        file_path: Path,
-        module_by_file: dict[Path, str],
+        summary: _ModuleSummary,
+        current_module: str,
         symbol_index: dict[str, dict[str, NodeID]],
     ) -> dict[str, NodeID]:
-        try:
-            source_text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return {}
-
-        try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", SyntaxWarning)
-                tree = ast.parse(source_text, filename=str(file_path))
-        except SyntaxError:
-            return {}
-
-        current_module = module_by_file[file_path]
         prebound: dict[str, NodeID] = {}
 
-        for stmt in tree.body:
-            if not isinstance(stmt, ast.ImportFrom):
-                continue
-
+        for import_from in summary.import_froms:
             resolved_module = self._resolve_import_from_module(
                 current_module=current_module,
-                level=stmt.level,
-                module=stmt.module,
+                level=import_from.level,
+                module=import_from.module,
             )
             if resolved_module is None:
                 continue
@@ -317,11 +521,8 @@ class CPGDirectoryBuilder(BaseModel):
                 continue
 
             module_symbols = symbol_index[resolved_module]
-            for alias in stmt.names:
-                if alias.name == "*":
-                    continue
-                local_name = alias.asname or alias.name
-                target_id = module_symbols.get(alias.name)
+            for imported_name, local_name in import_from.names:
+                target_id = module_symbols.get(imported_name)
                 if target_id is not None:
                     prebound[local_name] = target_id
 
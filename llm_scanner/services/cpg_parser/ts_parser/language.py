@@ -0,0 +1,11 @@
+"""Shared tree-sitter language objects for the Python grammar."""
+
+from typing import Final
+
+import tree_sitter_python as tspython
+from tree_sitter import Language, Query
+
+PYTHON_LANGUAGE: Final[Language] = Language(tspython.language())
+
+# Compiled once; compiling a query parses the pattern and builds its state machine.
+IDENTIFIER_QUERY: Final[Query] = Query(PYTHON_LANGUAGE, "(identifier) @identifier")
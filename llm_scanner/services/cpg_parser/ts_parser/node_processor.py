@@ -1,12 +1,15 @@
 import hashlib
 import logging
+import sys
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Callable, Mapping, Sequence
 from enum import StrEnum
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 
-from pydantic import BaseModel, Field, PrivateAttr
 from tree_sitter import Node as TSNode
+from tree_sitter import QueryCursor
 
 from models.base import NodeID
 from models.edges.base import RelationshipBase
@@ -21,6 +24,7 @@ from models.edges.data_flow import (
 from models.nodes import CallNode, CodeBlockNode, Node, VariableNode
 from models.nodes.base import NodeType
 from models.nodes.code import ClassNode, FunctionNode
+from services.cpg_parser.ts_parser.language import IDENTIFIER_QUERY
 from services.cpg_parser.types import ParserResult
 
 logger = logging.getLogger(__name__)
@@ -37,21 +41,84 @@ class ProcessableNodeTypes(StrEnum):
     EXPRESSION_STATEMENT = "expression_statement"
 
 
-class NodeProcessor(BaseModel):
-    path: Path
-    source: bytes
-    source_text: str
-    lines: list[str]
-    prebound_symbols: dict[str, NodeID] = Field(default_factory=dict)
-    visited_node_ids: set[str] = Field(default_factory=set)
+# Plain-string view for hot membership tests; ``in`` on the enum class goes
+# through ``EnumType.__contains__``.
+PROCESSABLE_NODE_TYPES: Final[frozenset[str]] = frozenset(
+    member.value for member in ProcessableNodeTypes
+)
+ASSIGNMENT_NODE_TYPES: Final[frozenset[str]] = frozenset(
+    {"assignment", "augmented_assignment", "annotated_assignment"}
+)
+# Module children of these types are never grouped into top-level code blocks.
+NON_STATEMENT_MODULE_CHILD_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "module",
+        "function_definition",
+        "class_definition",
+        "import_statement",
+        "import_from_statement",
+        "decorated_definition",
+    }
+)
+ASSIGNMENT_TARGET_NODE_TYPES: Final[frozenset[str]] = frozenset(
+    {"identifier", "subscript", "attribute"}
+)
+SYMBOL_SOURCE_KINDS: Final[frozenset[str]] = frozenset({"identifier", "attribute"})
+# Import statements hold only dotted names and aliases; descending into them
+# can neither create nodes nor reference a bound variable.
+SKIPPED_NODE_TYPES: Final[frozenset[str]] = frozenset(
+    {"import_statement", "import_from_statement", "future_import_statement"}
+)
+
 
-    __scope_stack: list[dict[str, NodeID]] = PrivateAttr(default_factory=lambda: [{}])
-    __caller_stack: list[NodeID] = PrivateAttr(default_factory=list[NodeID])
-    __all_functions: dict[str, list[NodeID]] = PrivateAttr(
-        default_factory=lambda: defaultdict(list[NodeID])
+def _start_byte(node: TSNode) -> int:
+    return node.start_byte
+
+
+class NodeProcessor:
+    """Walk one file's tree-sitter syntax tree and emit CPG nodes and edges.
+
+    This is a plain slotted class rather than a pydantic model: it never
+    crosses a serialization boundary, and its state is read on every visited
+    node, where pydantic's private-attribute lookup was a measurable cost.
+    """
+
+    __slots__ = (
+        "path",
+        "source",
+        "prebound_symbols",
+        "visited_node_ids",
+        "__scope_stack",
+        "__caller_stack",
+        "__all_functions",
+        "__max_node_name_len",
+        "__used_by_emitted",
+        "__path_str",
     )
-    __max_node_name_len: int = PrivateAttr(default=256)
-    __used_by_emitted: set[tuple[NodeID, NodeID]] = PrivateAttr(default_factory=set)
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        source: bytes,
+        prebound_symbols: dict[str, NodeID] | None = None,
+        visited_node_ids: set[str] | None = None,
+    ) -> None:
+        self.path: Path = path
+        self.source: bytes = source
+        self.prebound_symbols: dict[str, NodeID] = dict(prebound_symbols or {})
+        self.visited_node_ids: set[str] = (
+            visited_node_ids if visited_node_ids is not None else set()
+        )
+        self.__scope_stack: list[dict[str, NodeID]] = [{}]
+        self.__caller_stack: list[NodeID] = []
+        self.__all_functions: defaultdict[str, list[NodeID]] = defaultdict(list)
+        self.__max_node_name_len: int = 256
+        self.__used_by_emitted: set[tuple[NodeID, NodeID]] = set()
+        # Every NodeID embeds the file path; format and intern it once per file.
+        self.__path_str: str = sys.intern(str(path))
+        for name, node_id in self.prebound_symbols.items():
+            self.__bind_symbol(name, node_id)
 
     def __compact_node_name(self, name: str) -> str:
         """Clamp node names to a safe length for Neo4j indexes.
@@ -71,11 +138,6 @@ class NodeProcessor(BaseModel):
         head_len = max(0, self.__max_node_name_len - 10)
         return f"{normalized[:head_len]}-{digest[:8]}"
 
-    def model_post_init(self, __context: object) -> None:
-        for name, node_id in self.prebound_symbols.items():
-            self.__bind_symbol(name, node_id)
-        return super().model_post_init(__context)
-
     def __normalize_name(self, raw: str) -> str:
         """Normalize a name extracted from source code.
 
@@ -116,7 +178,7 @@ class NodeProcessor(BaseModel):
         self.__scope_stack[-1][normalized] = node_id
 
         # Track all functions globally for method resolution
-        if str(node_id).startswith("function:"):
+        if node_id.startswith("function:"):
             self.__all_functions[normalized].append(node_id)
 
     def __bind_class_symbol(self, node: TSNode) -> None:
@@ -177,18 +239,10 @@ class NodeProcessor(BaseModel):
                 actual = block_node
                 if block_node.type == "expression_statement":
                     for child in block_node.children:
-                        if child.type in {
-                            "assignment",
-                            "augmented_assignment",
-                            "annotated_assignment",
-                        }:
+                        if child.type in ASSIGNMENT_NODE_TYPES:
                             actual = child
                             break
-                if actual.type not in {
-                    "assignment",
-                    "augmented_assignment",
-                    "annotated_assignment",
-                }:
+                if actual.type not in ASSIGNMENT_NODE_TYPES:
                     continue
                 left = actual.child_by_field_name("left")
                 if not left:
@@ -197,7 +251,7 @@ class NodeProcessor(BaseModel):
                 annotation = actual.child_by_field_name("type")
                 if annotation:
                     type_hint = self.__normalize_name(self.__get_snippet(annotation))
-                for target_name, target_node in self.__iter_assignment_targets(left):
+                for target_name, target_node in self.__collect_assignment_targets(left):
                     if not target_name:
                         continue
                     var = self.__create_variable_node(
@@ -212,26 +266,23 @@ class NodeProcessor(BaseModel):
         return nodes
 
     def __resolve_symbol(self, name: str) -> NodeID | None:
-        normalized = self.__normalize_name(name)
-        for scope in reversed(self.__scope_stack):
-            node_id = scope.get(normalized)
-            if node_id:
-                return node_id
-        return None
+        return self.__resolve_symbol_with_depth(name)[0]
 
     def __resolve_symbol_with_depth(self, name: str) -> tuple[NodeID | None, int]:
         """Resolve a symbol name and return its scope depth.
 
+        Every caller passes a name that was already normalized while it was
+        extracted, so the lookup goes straight to the scope dictionaries.
+
         Returns:
             A tuple of (resolved NodeID or None, scope depth index).
             Depth 0 is the module-level scope. Returns (None, -1) if unresolved.
         """
-        normalized = self.__normalize_name(name)
-        for depth_from_top, scope in enumerate(reversed(self.__scope_stack)):
-            node_id = scope.get(normalized)
+        scopes = self.__scope_stack
+        for depth in range(len(scopes) - 1, -1, -1):
+            node_id = scopes[depth].get(name)
             if node_id:
-                actual_depth = len(self.__scope_stack) - 1 - depth_from_top
-                return node_id, actual_depth
+                return node_id, depth
         return None, -1
 
     def __maybe_emit_used_by(
@@ -250,7 +301,7 @@ class NodeProcessor(BaseModel):
         current_depth = len(self.__scope_stack) - 1
         if resolved_depth >= current_depth:
             return
-        if not str(resolved_id).startswith("variable:"):
+        if not resolved_id.startswith("variable:"):
             return
         key = (resolved_id, caller_id)
         if key in self.__used_by_emitted:
@@ -269,17 +320,23 @@ class NodeProcessor(BaseModel):
             return False
         if not node.is_named:
             return False
-        return node.type not in {
-            "module",
-            "function_definition",
-            "class_definition",
-            "import_statement",
-            "import_from_statement",
-            "decorated_definition",
-        }
+        return node.type not in NON_STATEMENT_MODULE_CHILD_TYPES
+
+    def __split_module_children(
+        self, module_node: TSNode
+    ) -> tuple[list[list[TSNode]], list[TSNode]]:
+        """Split module children into top-level statement blocks and the rest.
+
+        Each child is classified once here so the module passes in ``process``
+        can iterate the definitions directly.
+
+        Returns:
+            Runs of consecutive top-level statements, and all other children
+            (definitions, imports, punctuation) in source order.
+        """
 
-    def __iter_top_level_blocks(self, module_node: TSNode) -> list[list[TSNode]]:
         blocks: list[list[TSNode]] = []
+        definitions: list[TSNode] = []
         current_block: list[TSNode] = []
 
         for child in module_node.children:
@@ -287,6 +344,7 @@ class NodeProcessor(BaseModel):
                 current_block.append(child)
                 continue
 
+            definitions.append(child)
             if current_block:
                 blocks.append(current_block)
                 current_block = []
@@ -294,16 +352,17 @@ class NodeProcessor(BaseModel):
         if current_block:
             blocks.append(current_block)
 
-        return blocks
+        return blocks, definitions
 
     def __top_level_block_name(self, nodes: list[TSNode]) -> str:
+        # Only the block's first source line is needed, so it is sliced out of
+        # the raw bytes instead of splitting the whole file into lines.
         first_node: TSNode = nodes[0]
-        line_index: int = first_node.start_point[0]
-        if 0 <= line_index < len(self.lines):
-            return self.__normalize_name(self.lines[line_index].strip())
-
-        snippet: str = self.__get_snippet(first_node)
-        first_line: str = snippet.splitlines()[0] if snippet else ""
+        line_start: int = self.source.rfind(b"\n", 0, first_node.start_byte) + 1
+        line_end: int = self.source.find(b"\n", first_node.start_byte)
+        if line_end == -1:
+            line_end = len(self.source)
+        first_line: str = self.source[line_start:line_end].decode("utf-8", errors="replace")
         return self.__normalize_name(first_line.strip())
 
     def __create_code_block_node(self, nodes: list[TSNode]) -> CodeBlockNode:
@@ -315,7 +374,7 @@ class NodeProcessor(BaseModel):
         node_id: NodeID = NodeID.create(
             "code_block",
             block_name,
-            str(self.path),
+            self.__path_str,
             first_node.start_byte,
         )
         return CodeBlockNode(
@@ -325,45 +384,47 @@ class NodeProcessor(BaseModel):
             file_path=self.path,
         )
 
-    def __iter_identifiers(self, node: TSNode) -> Iterator[TSNode]:
-        if node.type == "identifier":
-            yield node
-        for child in node.children:
-            yield from self.__iter_identifiers(child)
+    # The tree walkers in this class use an explicit stack instead of recursive
+    # ``yield from`` chains, which re-yield every item through each level of
+    # nesting. Children are pushed in reverse to keep pre-order, and the stack
+    # methods are bound to locals once per walk. Every caller consumes the whole
+    # walk, so results are appended to a list rather than yielded.
 
-    def __iter_calls(self, node: TSNode) -> Iterator[TSNode]:
-        if node.type == "call":
-            yield node
-        for child in node.children:
-            yield from self.__iter_calls(child)
-
-    def __iter_source_atoms(self, node: TSNode) -> Iterator[tuple[str, str, TSNode]]:
-        """Yield atomic value sources (variables, attributes, calls).
+    def __collect_source_atoms(self, roots: Sequence[TSNode]) -> list[tuple[str, str, TSNode]]:
+        """Collect atomic value sources (variables, attributes, calls) under ``roots``.
 
         Notes:
             - For attribute nodes, we treat the full dotted expression as one symbol
               (e.g. "self.x") to avoid splitting into identifiers.
-            - For call nodes, we yield the call itself *and* recurse into its children
+            - For call nodes, we collect the call itself *and* recurse into its children
               so that argument dependencies are still captured.
         """
 
-        if node.type == "identifier":
-            yield ("identifier", self.__normalize_name(self.__get_snippet(node)), node)
-        elif node.type == "attribute":
-            yield ("attribute", self.__normalize_name(self.__get_snippet(node)), node)
-        elif node.type == "call":
-            yield ("call", self.__normalize_name(self.__get_snippet(node)), node)
-
-            # Only recurse into arguments (and other children), but skip the callee
-            # itself so we don't treat the function name as a value source.
-            callee = node.child_by_field_name("function")
-            for child in node.children:
-                if callee is not None and child == callee:
-                    continue
-                yield from self.__iter_source_atoms(child)
-        else:
-            for child in node.children:
-                yield from self.__iter_source_atoms(child)
+        normalize_name = self.__normalize_name
+        get_snippet = self.__get_snippet
+        atoms: list[tuple[str, str, TSNode]] = []
+        append = atoms.append
+        stack: list[TSNode] = list(reversed(roots))
+        pop = stack.pop
+        push_all = stack.extend
+        while stack:
+            current = pop()
+            node_type = current.type
+            if node_type == "identifier" or node_type == "attribute":
+                append((node_type, normalize_name(get_snippet(current)), current))
+                continue
+
+            children = current.children
+            if node_type == "call":
+                append(("call", normalize_name(get_snippet(current)), current))
+
+                # Only recurse into arguments (and other children), but skip the callee
+                # itself so we don't treat the function name as a value source.
+                callee = current.child_by_field_name("function")
+                if callee is not None:
+                    children = [child for child in children if child != callee]
+            push_all(reversed(children))
+        return atoms
 
     def __resolve_call_target(self, call_node: TSNode) -> NodeID | None:
         """Resolve a call node's callee to a known FunctionNode identifier."""
@@ -372,14 +433,14 @@ class NodeProcessor(BaseModel):
         if not function_node:
             return None
 
-        if function_node.type == "identifier":
+        # NodeID is a ``str`` subclass, so prefixes are checked without copying.
+        function_type = function_node.type
+        if function_type == "identifier":
             name = self.__normalize_name(self.__get_snippet(function_node))
             resolved = self.__resolve_symbol(name)
-            if resolved and (
-                str(resolved).startswith("function:") or str(resolved).startswith("class:")
-            ):
+            if resolved and resolved.startswith(("function:", "class:")):
                 return resolved
-        elif function_node.type == "attribute":
+        elif function_type == "attribute":
             # Handle method calls like obj.method()
             attribute_node = function_node.child_by_field_name("attribute")
             if not attribute_node or attribute_node.type != "identifier":
@@ -387,10 +448,11 @@ class NodeProcessor(BaseModel):
             method_name = self.__normalize_name(self.__get_snippet(attribute_node))
             # First try resolving in current scope
             resolved = self.__resolve_symbol(method_name)
-            if resolved and str(resolved).startswith("function:"):
+            if resolved and resolved.startswith("function:"):
                 return resolved
-            # Return the first match (could be improved with type inference)
-            candidates = self.__all_functions[method_name]
+            # Return the first match (could be improved with type inference).
+            # ``get`` avoids inserting an empty list for every unknown method.
+            candidates = self.__all_functions.get(method_name)
             if candidates:
                 return candidates[0]
         return None
@@ -416,21 +478,21 @@ class NodeProcessor(BaseModel):
                 call_id: NodeID = NodeID.create(
                     "call",
                     f"{method_name}()",
-                    str(self.path),
+                    self.__path_str,
                     call_node.start_byte,
                 )
             else:
                 call_id = NodeID.create(
                     "call",
                     snippet,
-                    str(self.path),
+                    self.__path_str,
                     call_node.start_byte,
                 )
         else:
             call_id = NodeID.create(
                 "call",
                 snippet,
-                str(self.path),
+                self.__path_str,
                 call_node.start_byte,
             )
 
@@ -464,30 +526,29 @@ class NodeProcessor(BaseModel):
             )
         )
 
-    def __iter_call_argument_atoms(self, call_node: TSNode) -> Iterator[tuple[str, str, TSNode]]:
-        """Yield argument atoms for a call node."""
+    def __collect_call_argument_atoms(self, call_node: TSNode) -> list[tuple[str, str, TSNode]]:
+        """Collect argument atoms for a call node."""
         arguments_node: TSNode | None = call_node.child_by_field_name("arguments")
         if arguments_node is None:
-            return
-        for child in arguments_node.children:
-            yield from self.__iter_source_atoms(child)
+            return []
+        return self.__collect_source_atoms(arguments_node.children)
 
     def __add_call_argument_edges(
         self,
         *,
-        call_node: TSNode,
+        argument_atoms: list[tuple[str, str, TSNode]],
         call_id: NodeID,
         edges: list[RelationshipBase],
     ) -> None:
         """Add data-flow edges from passed argument nodes to the call."""
         seen_source_ids: set[NodeID] = set()
         caller_id = self.__current_caller_id()
-        for kind, text, atom in self.__iter_call_argument_atoms(call_node):
+        for kind, text, atom in argument_atoms:
             if not text:
                 continue
 
             source_id: NodeID | None = None
-            if kind in {"identifier", "attribute"}:
+            if kind in SYMBOL_SOURCE_KINDS:
                 resolved, depth = self.__resolve_symbol_with_depth(text)
                 if resolved is not None:
                     source_id = resolved
@@ -509,7 +570,7 @@ class NodeProcessor(BaseModel):
                 source_id = NodeID.create(
                     "call",
                     nested_snippet,
-                    str(self.path),
+                    self.__path_str,
                     atom.start_byte,
                 )
 
@@ -529,38 +590,29 @@ class NodeProcessor(BaseModel):
         if not parameters_node:
             return []
 
-        identifiers: list[TSNode] = []
-        for child in parameters_node.children:
-            identifiers.extend(self.__iter_identifiers(child))
-
-        seen: set[tuple[int, int]] = set()
-        ordered: list[TSNode] = []
-        for ident in identifiers:
-            key = (ident.start_byte, ident.end_byte)
-            if key in seen:
-                continue
-            seen.add(key)
-            ordered.append(ident)
+        # The compiled query matches identifiers in C; they are leaves, so
+        # sorting by start byte restores source order, and each is captured once.
+        captures = QueryCursor(IDENTIFIER_QUERY).captures(parameters_node)
+        return sorted(captures.get("identifier", ()), key=_start_byte)
 
-        return ordered
-
-    def __iter_assignment_targets(self, node: TSNode) -> Iterator[tuple[str, TSNode]]:
-        """Iterate assignment targets on the LHS.
+    def __collect_assignment_targets(self, node: TSNode) -> list[tuple[str, TSNode]]:
+        """Collect assignment targets on the LHS.
 
         This supports simple identifiers, attributes (e.g. self.x), subscripts (e.g. a[i]),
         and destructuring (e.g. a, b = ...).
         """
 
-        if node.type in {"identifier", "subscript"}:
-            yield (self.__normalize_name(self.__get_snippet(node)), node)
-            return
-
-        if node.type == "attribute":
-            yield (self.__normalize_name(self.__get_snippet(node)), node)
-            return
-
-        for child in node.children:
-            yield from self.__iter_assignment_targets(child)
+        targets: list[tuple[str, TSNode]] = []
+        stack: list[TSNode] = [node]
+        pop = stack.pop
+        push_all = stack.extend
+        while stack:
+            current = pop()
+            if current.type in ASSIGNMENT_TARGET_NODE_TYPES:
+                targets.append((self.__normalize_name(self.__get_snippet(current)), current))
+                continue
+            push_all(reversed(current.children))
+        return targets
 
     def __create_variable_node(
         self,
@@ -573,7 +625,7 @@ class NodeProcessor(BaseModel):
         """Create a VariableNode for a definition or reference."""
 
         normalized_name = self.__compact_node_name(name)
-        node_id = NodeID.create(kind, normalized_name, str(self.path), node.start_byte)
+        node_id = NodeID.create(kind, normalized_name, self.__path_str, node.start_byte)
         variable_node = VariableNode(
             identifier=node_id,
             name=normalized_name,
@@ -614,25 +666,41 @@ class NodeProcessor(BaseModel):
     def __get_node_id(self, type_: NodeType, module_name: str, node: TSNode) -> NodeID:
         """Generate a unique identifier for the node based on its position."""
         compact_name = self.__compact_node_name(module_name)
-        return NodeID.create(type_, compact_name, str(self.path), node.start_byte)
+        return NodeID.create(type_, compact_name, self.__path_str, node.start_byte)
 
     def process(self, node: TSNode, block_level: int = 0) -> ParserResult:
         """Process a tree-sitter node and its children."""
 
         nodes: dict[NodeID, Node] = {}
         edges: list[RelationshipBase] = []
+        self.__process_into(node, block_level, nodes, edges)
+        return (nodes, edges)
+
+    def __process_into(
+        self,
+        node: TSNode,
+        block_level: int,
+        nodes: dict[NodeID, Node],
+        edges: list[RelationshipBase],
+    ) -> None:
+        """Process a node, adding its nodes and edges to the given accumulators.
+
+        Plain subtrees (expressions, control flow) write straight into the
+        caller's accumulators instead of building a dict and list per node that
+        the parent then merges. Scope and caller bookkeeping still needs
+        post-order hooks, so the walk stays recursive.
+        """
 
-        if node.type == "module":
-            top_level_blocks: list[list[TSNode]] = self.__iter_top_level_blocks(node)
+        node_type = node.type
+        if node_type == "module":
+            top_level_blocks, definitions = self.__split_module_children(node)
             for block_nodes in top_level_blocks:
                 code_block: CodeBlockNode = self.__create_code_block_node(block_nodes)
                 nodes[code_block.identifier] = code_block
                 self.visited_node_ids.add(code_block.identifier)
 
             # First pass: bind classes to register their names
-            for child in node.children:
-                if self.__is_top_level_statement(child):
-                    continue
+            for child in definitions:
                 if child.type == "class_definition":
                     self.__bind_class_symbol(child)
                 elif child.type == "decorated_definition":
@@ -642,9 +710,7 @@ class NodeProcessor(BaseModel):
                         self.__bind_class_symbol(definition)
 
             # Second pass: bind functions to register their names
-            for child in node.children:
-                if self.__is_top_level_statement(child):
-                    continue
+            for child in definitions:
                 if child.type == "function_definition":
                     self.__bind_function_symbol(child)
 
@@ -653,52 +719,34 @@ class NodeProcessor(BaseModel):
             nodes.update(prebound_vars)
 
             # Third pass: process all definitions (classes, functions, etc.)
-            for child in node.children:
-                if self.__is_top_level_statement(child):
-                    continue
-                child_nodes, child_edges = self.process(child, block_level)
-                nodes.update(child_nodes)
-                edges.extend(child_edges)
+            for child in definitions:
+                self.__process_into(child, block_level, nodes, edges)
 
             for block_nodes in top_level_blocks:
                 code_block_id: NodeID = NodeID.create(
                     "code_block",
                     self.__top_level_block_name(block_nodes),
-                    str(self.path),
+                    self.__path_str,
                     block_nodes[0].start_byte,
                 )
                 self.__push_caller(code_block_id)
                 for block_node in block_nodes:
-                    block_nodes_nodes, block_nodes_edges = self.process(block_node, block_level=1)
-                    nodes.update(block_nodes_nodes)
-                    edges.extend(block_nodes_edges)
+                    self.__process_into(block_node, 1, nodes, edges)
                 self.__pop_caller()
-            return (nodes, edges)
-
-        if node.type == "function_definition":
-            return self._process_function(node)
-        if node.type == "class_definition":
-            class_node, (nodes, edges) = self._process_class(node)
+            return
 
-            for node_id in nodes:
-                edges.append(
-                    DataFlowDefinedBy(
-                        src=class_node.identifier,
-                        dst=node_id,
-                        type=DataFlowRelationshipType.DEFINED_BY,
-                        operation=DefinitionOperation.ASSIGNMENT,
-                    )
-                )
-            nodes[class_node.identifier] = class_node
-            return (nodes, edges)
-        if node.type in {"assignment", "augmented_assignment", "annotated_assignment"}:
-            return self._process_assignment(node)
-        if node.type == "call":
-            return self._process_call(node)
+        if node_type in SKIPPED_NODE_TYPES:
+            return
+        handler = _NODE_HANDLERS.get(node_type)
+        if handler is not None:
+            handler_nodes, handler_edges = handler(self, node)
+            nodes.update(handler_nodes)
+            edges.extend(handler_edges)
+            return
 
         # Track outer-scope variable usage for bare identifier references
         # (e.g. ``return outer_var``, ``if outer_var:``, ``for x in outer_var:``).
-        if node.type == "identifier":
+        if node_type == "identifier":
             caller_id = self.__current_caller_id()
             if caller_id is not None:
                 text = self.__normalize_name(self.__get_snippet(node))
@@ -711,11 +759,10 @@ class NodeProcessor(BaseModel):
                         edges=edges,
                     )
 
-        for child in node.children:
-            _nodes, _edges = self.process(child, block_level)
-            nodes.update(_nodes)
-            edges.extend(_edges)
-        return (nodes, edges)
+        # Anonymous children are punctuation and keywords, which never yield nodes.
+        process_into = self.__process_into
+        for child in node.named_children:
+            process_into(child, block_level, nodes, edges)
 
     def _process_function(self, node: TSNode) -> ParserResult:
         """Process a function definition."""
@@ -777,16 +824,32 @@ class NodeProcessor(BaseModel):
 
         body_node = node.child_by_field_name("body")
         if body_node:
-            for child in body_node.children:
-                child_nodes, child_edges = self.process(child, block_level=1)
-                nodes.update(child_nodes)
-                edges.extend(child_edges)
+            process_into = self.__process_into
+            for child in body_node.named_children:
+                process_into(child, 1, nodes, edges)
 
         self.__pop_caller()
         self.__pop_scope()
 
         return (nodes, edges)
 
+    def _process_class_definition(self, node: TSNode) -> ParserResult:
+        """Process a class definition and link its members to the class node."""
+
+        class_node, (nodes, edges) = self._process_class(node)
+
+        for node_id in nodes:
+            edges.append(
+                DataFlowDefinedBy(
+                    src=class_node.identifier,
+                    dst=node_id,
+                    type=DataFlowRelationshipType.DEFINED_BY,
+                    operation=DefinitionOperation.ASSIGNMENT,
+                )
+            )
+        nodes[class_node.identifier] = class_node
+        return (nodes, edges)
+
     def _process_call(self, node: TSNode) -> ParserResult:
         """Process a call expression within a function."""
 
@@ -799,10 +862,11 @@ class NodeProcessor(BaseModel):
 
         # Scan call arguments for outer-scope variable usage even if
         # the callee is unresolved (e.g. built-in ``print``).
-        for kind, text, _atom in self.__iter_call_argument_atoms(node):
+        argument_atoms = self.__collect_call_argument_atoms(node)
+        for kind, text, _atom in argument_atoms:
             if not text:
                 continue
-            if kind in {"identifier", "attribute"}:
+            if kind in SYMBOL_SOURCE_KINDS:
                 resolved, depth = self.__resolve_symbol_with_depth(text)
                 if resolved is not None:
                     self.__maybe_emit_used_by(
@@ -831,14 +895,13 @@ class NodeProcessor(BaseModel):
             callee_id=callee_id,
         )
         self.__add_call_argument_edges(
-            call_node=node,
+            argument_atoms=argument_atoms,
             call_id=call_node.identifier,
             edges=edges,
         )
-        for child in node.children:
-            child_nodes, child_edges = self.process(child, block_level=1)
-            nodes.update(child_nodes)
-            edges.extend(child_edges)
+        process_into = self.__process_into
+        for child in node.named_children:
+            process_into(child, 1, nodes, edges)
         return (nodes, edges)
 
     def _process_class(self, node: TSNode) -> tuple[Node, ParserResult]:
@@ -876,11 +939,9 @@ class NodeProcessor(BaseModel):
         self.__bind_symbol(name, node_id)
 
         for children in node.children:
-            if children.type not in ProcessableNodeTypes:
+            if children.type not in PROCESSABLE_NODE_TYPES:
                 continue
-            child_nodes, child_edges = self.process(children, block_level=1)
-            nodes.update(child_nodes)
-            edges.extend(child_edges)
+            self.__process_into(children, 1, nodes, edges)
 
         return (class_node, (nodes, edges))
 
@@ -905,7 +966,7 @@ class NodeProcessor(BaseModel):
         if annotation:
             type_hint = self.__normalize_name(self.__get_snippet(annotation))
 
-        targets = list(self.__iter_assignment_targets(left))
+        targets = self.__collect_assignment_targets(left)
         if not targets:
             return (nodes, edges)
 
@@ -914,11 +975,11 @@ class NodeProcessor(BaseModel):
 
         current_caller_id = self.__current_caller_id()
 
-        for kind, text, atom in self.__iter_source_atoms(right):
+        for kind, text, atom in self.__collect_source_atoms((right,)):
             if not text:
                 continue
 
-            if kind in {"identifier", "attribute"}:
+            if kind in SYMBOL_SOURCE_KINDS:
                 resolved, depth = self.__resolve_symbol_with_depth(text)
                 if resolved and resolved not in seen_source_ids:
                     source_ids.append(resolved)
@@ -960,7 +1021,7 @@ class NodeProcessor(BaseModel):
                     callee_id=target_id,
                 )
                 self.__add_call_argument_edges(
-                    call_node=atom,
+                    argument_atoms=self.__collect_call_argument_atoms(atom),
                     call_id=call_node.identifier,
                     edges=edges,
                 )
@@ -999,3 +1060,19 @@ class NodeProcessor(BaseModel):
                 )
 
         return (nodes, edges)
+
+
+# Node types with a dedicated handler; every other type falls through to the
+# generic child traversal in ``NodeProcessor.process``.
+_NODE_HANDLERS: Final[Mapping[str, Callable[[NodeProcessor, TSNode], ParserResult]]] = (
+    MappingProxyType(
+        {
+            "function_definition": NodeProcessor._process_function,
+            "class_definition": NodeProcessor._process_class_definition,
+            "assignment": NodeProcessor._process_assignment,
+            "augmented_assignment": NodeProcessor._process_assignment,
+            "annotated_assignment": NodeProcessor._process_assignment,
+            "call": NodeProcessor._process_call,
+        }
+    )
+)
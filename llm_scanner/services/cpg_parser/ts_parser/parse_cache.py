@@ -0,0 +1,79 @@
+"""On-disk cache of per-file CPG build results.
+
+``CPGDirectoryBuilder`` keeps built per-file graphs in memory for the life of
+the process. This module persists them between runs so that re-scanning a
+project only re-parses files that changed. Each entry is one pickle file named
+after the file's identity (path, project root and pre-bound symbols) and
+stores the full cache key, so an entry written before an edit is detected by
+its stale modification time and size and simply overwritten.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from models.base import NodeID
+from services.cpg_parser.types import ParserResult
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump when node or edge models change shape; old entries are then ignored.
+_CACHE_SCHEMA_VERSION = 1
+
+# (path, root, st_mtime_ns, st_size, pre-bound symbols)
+type FileCacheKey = tuple[str, str, int, int, frozenset[tuple[str, NodeID]]]
+
+
+def file_cpg_entry_path(cache_dir: Path, cache_key: FileCacheKey) -> Path:
+    """Return the on-disk path for the entry of the file described by ``cache_key``."""
+
+    path, root, _mtime_ns, _size, prebound_symbols = cache_key
+    parts = (
+        f"v{_CACHE_SCHEMA_VERSION}",
+        path,
+        root,
+        repr(sorted(prebound_symbols)),
+    )
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.pkl"
+
+
+def load_file_cpg(cache_dir: Path, cache_key: FileCacheKey) -> ParserResult | None:
+    """Load a cached per-file graph, returning None when absent or stale.
+
+    Corrupt or outdated entries (truncated pickles, or ones referring to
+    classes that have since moved or changed) are logged and treated as
+    misses; the next save overwrites them. Entries are unpickled, so
+    ``cache_dir`` must only ever hold files this module wrote.
+    """
+
+    target = file_cpg_entry_path(cache_dir, cache_key)
+    try:
+        with target.open("rb") as fp:
+            stored_key, result = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+        _LOGGER.exception("Ignoring unreadable CPG cache entry: %s", target)
+        return None
+
+    if stored_key != cache_key:
+        return None
+    return result
+
+
+def save_file_cpg(cache_dir: Path, cache_key: FileCacheKey, result: ParserResult) -> None:
+    """Persist a per-file graph under ``cache_dir``.
+
+    The entry is written to a temporary file and renamed into place so that
+    concurrent builds never read a partially written pickle.
+    """
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    target = file_cpg_entry_path(cache_dir, cache_key)
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with temporary.open("wb") as fp:
+        pickle.dump((cache_key, result), fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, target)
@@ -1,11 +1,15 @@
 """Tunable coefficient configuration for context-node ranking strategies."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
 
+# libyaml-backed C loader/dumper when available; same safe-subset semantics.
+_YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: Final = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class CombinerWeights(BaseModel):
     """Top-level weights that combine the four component scores into a final score."""
@@ -152,7 +156,7 @@ class RankingCoefficients(BaseModel):
             Parsed coefficients object.
         """
 
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
         if not isinstance(raw, dict):
             raise ValueError(f"coefficients YAML must be a mapping: {path}")
         return cls.model_validate(raw)
@@ -167,6 +171,6 @@ class RankingCoefficients(BaseModel):
         path.parent.mkdir(parents=True, exist_ok=True)
         payload: dict[str, Any] = self.model_dump()
         path.write_text(
-            yaml.safe_dump(payload, sort_keys=False, default_flow_style=False),
+            yaml.dump(payload, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False),
             encoding="utf-8",
         )
@@ -1,9 +1,32 @@
+import io
+from array import array
 from pathlib import Path
 from threading import Lock
-from typing import cast
+from typing import Final, cast
 
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+# Files at least this large are indexed by line offset instead of being split
+# into one string per line; snippets are then decoded from the raw bytes.
+LARGE_FILE_BYTES: Final[int] = 64 * 1024
+
+
+def _line_offsets(data: bytes) -> array[int]:
+    """Return the byte offset of every line start plus a trailing end offset.
+
+    Offsets are packed into an unsigned 64-bit array rather than a list of
+    int objects, since a large file has one entry per line.
+    """
+
+    offsets = array("Q", [0])
+    position = data.find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = data.find(b"\n", position + 1)
+    if offsets[-1] != len(data):
+        offsets.append(len(data))
+    return offsets
+
 
 class SnippetReaderService(BaseModel):
     """Read and cache source snippets for ranking heuristics."""
@@ -17,6 +40,9 @@ class SnippetReaderService(BaseModel):
     _file_lines_cache: dict[Path, list[str]] = PrivateAttr(
         default_factory=lambda: cast(dict[Path, list[str]], {})
     )
+    _file_offsets_cache: dict[Path, tuple[bytes, array[int]]] = PrivateAttr(
+        default_factory=lambda: cast(dict[Path, tuple[bytes, array[int]]], {})
+    )
     _snippet_cache: dict[tuple[Path, int, int], str] = PrivateAttr(
         default_factory=lambda: cast(dict[tuple[Path, int, int], str], {})
     )
@@ -28,9 +54,6 @@ class SnippetReaderService(BaseModel):
             return ""
 
         absolute_path = (self.project_root / file_path).resolve()
-        if not absolute_path.exists():
-            return ""
-
         snippet_key = (absolute_path, line_start, line_end)
 
         with self._cache_lock:
@@ -38,18 +61,9 @@ class SnippetReaderService(BaseModel):
         if cached_snippet is not None:
             return cached_snippet
 
-        with self._cache_lock:
-            lines = self._file_lines_cache.get(absolute_path)
-
-        if lines is None:
-            with absolute_path.open("r", encoding="utf-8", errors="ignore") as handle:
-                lines = handle.readlines()
-            with self._cache_lock:
-                self._file_lines_cache[absolute_path] = lines
-
-        start_index = max(line_start - 1, 0)
-        end_index = min(line_end, len(lines))
-        snippet = "".join(lines[start_index:end_index]).rstrip()
+        snippet = self._read_lines_range(absolute_path, line_start - 1, line_end)
+        if snippet is None:
+            return ""
 
         with self._cache_lock:
             if len(self._snippet_cache) >= self.cache_max_entries:
@@ -57,3 +71,50 @@ class SnippetReaderService(BaseModel):
             self._snippet_cache[snippet_key] = snippet
 
         return snippet
+
+    def _read_lines_range(
+        self, absolute_path: Path, start_index: int, end_index: int
+    ) -> str | None:
+        """Return lines ``[start_index, end_index)`` of a file joined and right-stripped.
+
+        Returns ``None`` when the file does not exist.
+        """
+
+        cached: list[str] | tuple[bytes, array[int]] | None
+        with self._cache_lock:
+            cached = self._file_lines_cache.get(absolute_path)
+            if cached is None:
+                cached = self._file_offsets_cache.get(absolute_path)
+        if cached is None:
+            try:
+                cached = self._load_file(absolute_path)
+            except FileNotFoundError:
+                return None
+
+        if isinstance(cached, list):
+            return "".join(cached[start_index:end_index]).rstrip()
+
+        data, offsets = cached
+        end_index = min(end_index, len(offsets) - 1)
+        if start_index >= end_index:
+            return ""
+        chunk = data[offsets[start_index] : offsets[end_index]]
+        return chunk.decode("utf-8", errors="ignore").rstrip()
+
+    def _load_file(self, absolute_path: Path) -> list[str] | tuple[bytes, array[int]]:
+        """Read a file into the line cache or, for large files, the offset index."""
+
+        data = absolute_path.read_bytes()
+        # Bare carriage returns are line breaks for universal newlines but not
+        # for the offset index, so such files always take the per-line path.
+        if len(data) < LARGE_FILE_BYTES or b"\r" in data:
+            text = data.decode("utf-8", errors="ignore")
+            lines = io.StringIO(text, newline=None).readlines()
+            with self._cache_lock:
+                self._file_lines_cache[absolute_path] = lines
+            return lines
+
+        indexed = (data, _line_offsets(data))
+        with self._cache_lock:
+            self._file_offsets_cache[absolute_path] = indexed
+        return indexed
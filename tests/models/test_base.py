@@ -0,0 +1,36 @@
+"""Tests for the NodeID pydantic integration."""
+
+import pytest
+
+from models.base import NodeID
+from models.edges.call_graph import CallGraphCalls
+
+
+@pytest.fixture(autouse=True)
+def clear_neo4j_database() -> None:
+    """Override the global Neo4j autouse fixture for pure unit tests."""
+
+    return None
+
+
+def test_node_id_fields_reuse_existing_node_ids() -> None:
+    """Validating an existing NodeID keeps the same object rather than copying it."""
+
+    src = NodeID.create("function", "caller", "pkg/mod.py", 10)
+    dst = NodeID.create("function", "callee", "pkg/mod.py", 42)
+
+    edge = CallGraphCalls(src=src, dst=dst)
+
+    assert edge.src is src
+    assert edge.dst is dst
+
+
+def test_node_id_fields_convert_plain_strings() -> None:
+    """Plain strings, including JSON input, still validate into NodeID."""
+
+    edge = CallGraphCalls(src="function:a@m.py:0", dst="function:b@m.py:1")
+    from_json = CallGraphCalls.model_validate_json(edge.model_dump_json())
+
+    assert type(edge.src) is NodeID
+    assert type(from_json.dst) is NodeID
+    assert from_json == edge
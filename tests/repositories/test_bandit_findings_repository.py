@@ -1,11 +1,15 @@
-"""Integration tests for BanditFindingsRepository."""
+"""Tests for BanditFindingsRepository."""
 
 from pathlib import Path
+from unittest.mock import Mock
 
 from clients.neo4j import Neo4jClient
 from models.bandit_report import IssueSeverity
+from models.base import NodeID
+from models.edges.analysis import StaticAnalysisReports
 from models.nodes.finding import BanditFindingNode
 from repositories.analyzers.bandit import BanditFindingsRepository
+from repositories.base import FINDING_WRITE_BATCH_SIZE
 from tests.repositories.conftest import BANDIT_FINDING_QUERY
 
 
@@ -29,3 +33,32 @@ def test_bandit_findings_repository_inserts_nodes(neo4j_client: Neo4jClient) ->
     assert rows[0]["file"] == "src/app.py"
     assert rows[0]["cwe_id"] == 79
     assert rows[0]["severity"] == IssueSeverity.HIGH.value
+
+
+def test_bandit_findings_repository_chunks_node_and_edge_writes() -> None:
+    """Large finding payloads should be split into bounded UNWIND transactions."""
+
+    client = Mock(spec=Neo4jClient)
+    client.cfg = Mock(uri="bolt://chunked-writes")
+    repo: BanditFindingsRepository = BanditFindingsRepository(client=client)
+    client.run_write.reset_mock()
+
+    findings: list[BanditFindingNode] = [
+        BanditFindingNode(
+            file=Path("src/app.py"),
+            line_number=line_number,
+            cwe_id=79,
+            severity=IssueSeverity.LOW,
+        )
+        for line_number in range(1, FINDING_WRITE_BATCH_SIZE + 2)
+    ]
+    repo.insert_nodes(findings)
+    repo.insert_edges(
+        [
+            StaticAnalysisReports(src=str(finding.identifier), dst=NodeID("function:f@a.py:0"))
+            for finding in findings
+        ]
+    )
+
+    batch_sizes: list[int] = [len(call.args[1]["rows"]) for call in client.run_write.call_args_list]
+    assert batch_sizes == [FINDING_WRITE_BATCH_SIZE, 1, FINDING_WRITE_BATCH_SIZE, 1]
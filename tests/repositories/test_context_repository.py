@@ -293,3 +293,80 @@ def test_fetch_taint_sources_deduplicates_root_ids_before_query() -> None:
 
     _, params = client.run_read.call_args_list[1].args
     assert params == {"root_ids": ["node-1", "node-2"]}
+
+
+def test_fetch_code_neighborhoods_by_start_id_partitions_rows_by_start() -> None:
+    """A single batch query should be split back into per-start neighborhoods."""
+
+    def _row(start_id: str, node_id: str, depth: int) -> dict[str, object]:
+        return {
+            "start_id": start_id,
+            "id": node_id,
+            "depth": depth,
+            "file_path": "src/app.py",
+            "line_start": 1,
+            "line_end": 5,
+            "node_kind": "FunctionNode",
+            "name": node_id,
+        }
+
+    client = Mock(spec=Neo4jClient)
+    client.run_write.return_value = None
+    client.run_read.side_effect = [
+        [{"relationshipType": "CALLS"}],
+        [
+            _row("root-a", "root-a", 0),
+            _row("root-b", "root-b", 0),
+            _row("root-a", "shared", 1),
+            _row("root-b", "shared", 2),
+        ],
+    ]
+
+    repository = ContextRepository(client=client)
+
+    neighborhoods = repository.fetch_code_neighborhoods_by_start_id(
+        ["root-b", "root-a", "root-a"], 2
+    )
+
+    assert client.run_read.call_count == 2
+    assert client.run_read.call_args.args[1]["start_ids"] == ["root-a", "root-b"]
+    assert {
+        start_id: [(str(node.identifier), node.depth) for node in nodes]
+        for start_id, nodes in neighborhoods.items()
+    } == {
+        "root-a": [("root-a", 0), ("shared", 1)],
+        "root-b": [("root-b", 0), ("shared", 2)],
+    }
+
+
+def test_fetch_code_neighborhood_batch_uses_server_side_dedup_counts() -> None:
+    """Multi-start fetches should trust the depth and repeats computed by Neo4j."""
+
+    client = Mock(spec=Neo4jClient)
+    client.cfg = Mock(uri="bolt://multi-source-test")
+    client.run_read.side_effect = [
+        [{"relationshipType": "CALLS"}],
+        [
+            {
+                "id": "node-1",
+                "depth": 1,
+                "repeats": 2,
+                "file_path": "src/app.py",
+                "line_start": 1,
+                "line_end": 5,
+                "node_kind": "FunctionNode",
+                "name": "alpha",
+            },
+        ],
+    ]
+
+    repository = ContextRepository(client=client)
+
+    nodes = repository.fetch_code_neighborhood_batch(["node-2", "node-1", "node-3"], 2)
+
+    query, params = client.run_read.call_args.args
+    assert "min(start_depth)" in query
+    assert params["start_ids"] == ["node-1", "node-2", "node-3"]
+    assert [(str(node.identifier), node.depth, node.repeats) for node in nodes] == [
+        ("node-1", 1, 2)
+    ]
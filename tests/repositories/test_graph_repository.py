@@ -1,12 +1,17 @@
-"""Integration tests for GraphRepository."""
+"""Tests for GraphRepository."""
 
 from pathlib import Path
+from unittest.mock import Mock
 
 from clients.neo4j import Neo4jClient
 from models.base import NodeID
+from models.edges import RelationshipBase
 from models.edges.call_graph import CallGraphCalls
-from models.nodes.code import FunctionNode
+from models.edges.data_flow import DataFlowFlowsTo
+from models.nodes import Node
+from models.nodes.code import ClassNode, FunctionNode
 from repositories.graph import GraphRepository
+from repositories.queries import NODE_QUERY_BY_LABEL, RELATIONSHIP_QUERY_BY_TYPE
 from tests.repositories.conftest import GRAPH_EDGE_QUERY, GRAPH_NODE_QUERY
 
 
@@ -53,3 +58,40 @@ def test_graph_repository_load_inserts_nodes_and_edges(neo4j_client: Neo4jClient
     )
     assert len(edge_rows) == 1
     assert edge_rows[0]["rel_type"] == "CALLS"
+
+
+def test_graph_repository_load_writes_all_nodes_before_edges() -> None:
+    """Edge writes MATCH on node ids, so every node write must happen first."""
+
+    client = Mock(spec=Neo4jClient)
+    client.cfg = Mock(uri="bolt://graph-load-order")
+    repo: GraphRepository = GraphRepository(client)
+    client.run_write.reset_mock()
+
+    file_path: Path = Path("src/app.py")
+    function_id: NodeID = NodeID.create("function", "alpha", file_path, 10)
+    class_id: NodeID = NodeID.create("class", "Beta", file_path, 50)
+    nodes: dict[NodeID, Node] = {
+        function_id: FunctionNode(
+            identifier=function_id, file_path=file_path, line_start=1, line_end=5, name="alpha"
+        ),
+        class_id: ClassNode(
+            identifier=class_id, file_path=file_path, line_start=10, line_end=10, name="Beta"
+        ),
+    }
+    edges: list[RelationshipBase] = [
+        CallGraphCalls(src=function_id, dst=class_id),
+        DataFlowFlowsTo(src=function_id, dst=class_id),
+    ]
+
+    repo.load(nodes, edges)
+
+    written_queries: list[str] = [call.args[0] for call in client.run_write.call_args_list]
+    node_queries: set[str] = {NODE_QUERY_BY_LABEL["Function"], NODE_QUERY_BY_LABEL["Class"]}
+    edge_queries: set[str] = {
+        RELATIONSHIP_QUERY_BY_TYPE["CALLS"],
+        RELATIONSHIP_QUERY_BY_TYPE["FLOWS_TO"],
+    }
+    # The first write clears the database.
+    assert set(written_queries[1:3]) == node_queries
+    assert set(written_queries[3:]) == edge_queries
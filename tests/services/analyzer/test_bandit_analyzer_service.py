@@ -5,6 +5,9 @@ import pytest
 
 from clients.analyzers.bandit import BanditStaticAnalyzer
 from models.bandit_report import BanditIssue, IssueSeverity
+from models.base import NodeID, StaticAnalyzerReport
+from models.nodes import Node
+from models.nodes.code import FunctionNode
 from models.nodes.finding import BanditFindingNode
 from repositories.analyzers.base import IFindingsRepository
 from repositories.graph import GraphRepository
@@ -104,3 +107,65 @@ def test_normalize_issue_path_handles_absolute_paths(
     absolute_path = tmp_path / "src" / "app.py"
     normalized = bandit_service._normalize_issue_path(absolute_path)
     assert normalized == Path("src/app.py")
+
+
+def test_normalize_issue_path_handles_paths_outside_target(
+    bandit_service: BanditAnalyzerService,
+    tmp_path: Path,
+) -> None:
+    outside_path = tmp_path.parent / "vendored" / "lib.py"
+    normalized = bandit_service._normalize_issue_path(outside_path)
+    assert normalized == Path("../vendored/lib.py")
+
+
+def test_normalize_issue_path_memoizes_repeated_paths(
+    bandit_service: BanditAnalyzerService,
+    tmp_path: Path,
+) -> None:
+    absolute_path = tmp_path / "src" / "app.py"
+    first = bandit_service._normalize_issue_path(absolute_path)
+    second = bandit_service._normalize_issue_path(absolute_path)
+    assert first == Path("src/app.py")
+    assert second is first
+
+
+def test_get_findings_with_edges_links_findings_to_enclosing_nodes(
+    bandit_service: BanditAnalyzerService,
+    tmp_path: Path,
+) -> None:
+    def _issue(file: Path, line_number: int) -> BanditIssue:
+        return BanditIssue(
+            cwe=78,
+            file=file,
+            line_number=line_number,
+            column_number=0,
+            line_range=[line_number],
+            severity=IssueSeverity.HIGH,
+            reason="subprocess call",
+        )
+
+    analyzer = MagicMock(spec=BanditStaticAnalyzer)
+    analyzer.run.return_value = StaticAnalyzerReport[BanditIssue](
+        issues=[
+            _issue(tmp_path / "src" / "app.py", 3),
+            _issue(Path("src/app.py"), 12),
+            _issue(Path("src/other.py"), 1),
+        ]
+    )
+    bandit_service.__dict__["_static_analyzer"] = analyzer
+
+    app_path = Path("src/app.py")
+    outer_id = NodeID.create("function", "outer", app_path, 0)
+    inner_id = NodeID.create("function", "inner", app_path, 20)
+    nodes: list[Node] = [
+        FunctionNode(identifier=outer_id, file_path=app_path, line_start=1, line_end=10, name="o"),
+        FunctionNode(identifier=inner_id, file_path=app_path, line_start=2, line_end=4, name="i"),
+    ]
+
+    findings, edges = bandit_service.get_findings_with_edges(nodes)
+
+    assert [finding.file for finding in findings] == [app_path, app_path, Path("src/other.py")]
+    assert [(edge.src, edge.dst) for edge in edges] == [
+        (str(findings[0].identifier), outer_id),
+        (str(findings[0].identifier), inner_id),
+    ]
@@ -224,3 +224,31 @@ def test_path_fill_disconnected_node_still_included_when_budget_allows(
 
     assert "def root_anchor" in context.context_text
     assert "def detached" in context.context_text
+
+
+def test_render_reads_each_file_once_across_assemble_calls(tmp_path: Path) -> None:
+    """Repeated assembly over the same file is served from the line cache."""
+
+    _write_file(
+        tmp_path,
+        "def root_anchor():\n    pass\ndef other_anchor():\n    pass\n",
+    )
+
+    first_root = _make_node("root_anchor", line_start=1, line_end=2, depth=0, score=1.0)
+    second_root = _make_node("other_anchor", line_start=3, line_end=4, depth=0, score=1.0)
+
+    service = ContextAssemblerService(
+        project_root=tmp_path,
+        context_repository=None,
+        cached_neighborhood_edges=[],
+        max_call_depth=4,
+        token_budget=1_000,
+        ranking_strategy=_ScoreSortStrategy(),
+    )
+
+    first_context = service.assemble_from_nodes(tmp_path, [first_root])
+    (tmp_path / "app.py").unlink()
+    second_context = service.assemble_from_nodes(tmp_path, [second_root])
+
+    assert first_context.context_text == "def root_anchor():\n    pass"
+    assert second_context.context_text == "def other_anchor():\n    pass"
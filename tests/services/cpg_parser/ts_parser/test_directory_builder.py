@@ -1,10 +1,33 @@
+import os
 from pathlib import Path
 
+import pytest
+
+from models.base import NodeID
 from models.nodes import FunctionNode
+from services.cpg_parser.ts_parser import cpg_builder
 from services.cpg_parser.ts_parser.cpg_builder import CPGDirectoryBuilder
+from services.cpg_parser.types import ParserResult
 from tests.consts import SAMPLE_PROJECT_ROOT
 
 
+@pytest.fixture
+def parsed_paths(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every file the directory builder parses, in call order."""
+
+    paths: list[Path] = []
+    original_build_file_cpg = cpg_builder._build_file_cpg
+
+    def recording_build_file_cpg(
+        path: Path, root: Path, prebound_symbols: dict[str, NodeID]
+    ) -> ParserResult:
+        paths.append(path)
+        return original_build_file_cpg(path, root, prebound_symbols)
+
+    monkeypatch.setattr(cpg_builder, "_build_file_cpg", recording_build_file_cpg)
+    return paths
+
+
 def test_cpg_directory_builder__parses_multiple_files() -> None:
     """Validate directory parsing merges results from multiple .py files."""
 
@@ -23,3 +46,102 @@ def test_cpg_directory_builder__parses_multiple_files() -> None:
         isinstance(node, FunctionNode) and node.name == "greet" and node.file_path == utils_file
         for node in nodes.values()
     )
+
+
+def test_cpg_directory_builder__process_pool_matches_serial_build(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parsing files in worker processes yields the same graph as a serial build."""
+
+    serial_nodes, serial_edges = CPGDirectoryBuilder(
+        root=SAMPLE_PROJECT_ROOT, max_workers=1
+    ).build()
+
+    monkeypatch.setattr(cpg_builder, "PARALLEL_MIN_FILES", 1)
+    parallel_nodes, parallel_edges = CPGDirectoryBuilder(
+        root=SAMPLE_PROJECT_ROOT, max_workers=2
+    ).build()
+
+    assert parallel_nodes == serial_nodes
+    assert parallel_edges == serial_edges
+
+
+def test_cpg_directory_builder__parses_unlinked_files_once_per_build(
+    parsed_paths: list[Path], tmp_path: Path
+) -> None:
+    """Files with no imports to bind reuse their symbol-index graph within a build.
+
+    Separate builds parse again and never share node objects.
+    """
+
+    module_path = tmp_path / "mod.py"
+    module_path.write_text("def first():\n    return 1\n", encoding="utf-8")
+    other_path = tmp_path / "other.py"
+    other_path.write_text(
+        "from mod import first\n\n\ndef other():\n    return first()\n", encoding="utf-8"
+    )
+
+    builder = CPGDirectoryBuilder(root=tmp_path)
+
+    first_nodes, _ = builder.build()
+    assert sorted(parsed_paths) == [module_path, other_path, other_path]
+
+    parsed_paths.clear()
+    second_nodes, _ = builder.build()
+    assert sorted(parsed_paths) == [module_path, other_path, other_path]
+    assert second_nodes == first_nodes
+    assert all(node is not first_nodes[node_id] for node_id, node in second_nodes.items())
+
+
+def test_cpg_directory_builder__skips_parsing_empty_files(
+    parsed_paths: list[Path], tmp_path: Path
+) -> None:
+    """Empty files contribute nothing and never reach the parser."""
+
+    package_dir = tmp_path / "pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_bytes(b"")
+    module_path = package_dir / "mod.py"
+    module_path.write_text("def only():\n    return 1\n", encoding="utf-8")
+
+    nodes, _ = CPGDirectoryBuilder(root=tmp_path, link_imports=False).build()
+
+    assert parsed_paths == [module_path]
+    assert all(node.file_path == Path("pkg/mod.py") for node in nodes.values())
+
+
+def test_cpg_directory_builder__reuses_graphs_persisted_in_cache_dir(
+    parsed_paths: list[Path], tmp_path: Path
+) -> None:
+    """A later build reloads unchanged files from ``cache_dir`` and re-parses edited ones."""
+
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    cache_dir = tmp_path / "cache"
+    (project_root / "mod.py").write_text("def first():\n    return 1\n", encoding="utf-8")
+    (project_root / "other.py").write_text(
+        "from mod import first\n\n\ndef other():\n    return first()\n", encoding="utf-8"
+    )
+
+    first_nodes, first_edges = CPGDirectoryBuilder(root=project_root, cache_dir=cache_dir).build()
+    parsed_paths.clear()
+
+    cached_nodes, cached_edges = CPGDirectoryBuilder(root=project_root, cache_dir=cache_dir).build()
+
+    assert parsed_paths == []
+    assert cached_nodes == first_nodes
+    assert cached_edges == first_edges
+
+    module_path = project_root / "mod.py"
+    module_path.write_text("def second():\n    return 1\n", encoding="utf-8")
+    stat_result = module_path.stat()
+    os.utime(module_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    edited_nodes, _ = CPGDirectoryBuilder(root=project_root, cache_dir=cache_dir).build()
+    assert module_path in parsed_paths
+    assert any(
+        isinstance(node, FunctionNode) and node.name == "second" for node in edited_nodes.values()
+    )
+    assert not any(
+        isinstance(node, FunctionNode) and node.name == "first" for node in edited_nodes.values()
+    )
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from services.snippet_reader import LARGE_FILE_BYTES, SnippetReaderService
+
+
+def _write_large_file(tmp_path: Path, newline: str) -> list[str]:
+    lines = [f"value_{index} = {index}  # padding" for index in range(LARGE_FILE_BYTES // 16)]
+    (tmp_path / "big.py").write_bytes(newline.join(lines).encode("utf-8"))
+    return lines
+
+
+def test_read_snippet_large_file_matches_line_slice(tmp_path: Path) -> None:
+    """Offset-indexed large files should return the same snippet as a line slice."""
+    lines = _write_large_file(tmp_path, "\n")
+    reader = SnippetReaderService(project_root=tmp_path)
+
+    assert reader.read_snippet(Path("big.py"), 900, 905) == "\n".join(lines[899:905])
+    assert reader.read_snippet(Path("big.py"), len(lines), len(lines) + 10) == lines[-1]
+    assert reader.read_snippet(Path("big.py"), len(lines) + 1, len(lines) + 2) == ""
+
+
+def test_read_snippet_large_file_with_crlf_normalizes_newlines(tmp_path: Path) -> None:
+    """Files containing carriage returns keep universal-newline semantics."""
+    lines = _write_large_file(tmp_path, "\r\n")
+    reader = SnippetReaderService(project_root=tmp_path)
+
+    assert reader.read_snippet(Path("big.py"), 10, 12) == "\n".join(lines[9:12])
+
+
+def test_read_snippet_missing_file_returns_empty(tmp_path: Path) -> None:
+    """Missing files should yield an empty snippet instead of raising."""
+    reader = SnippetReaderService(project_root=tmp_path)
+
+    assert reader.read_snippet(Path("missing.py"), 1, 3) == ""
+
+    (tmp_path / "missing.py").write_text("created = True\n", encoding="utf-8")
+    assert reader.read_snippet(Path("missing.py"), 1, 3) == "created = True"